@@ -1,4 +1,32 @@
-from .storage import FileProviderBase, FileReference
-from .collections import CollectionBase, TimestampedCollectionBase
+from typing import TYPE_CHECKING
 
-__all__ = ['FileProviderBase', 'CollectionBase', 'TimestampedCollectionBase', 'FileReference']
\ No newline at end of file
+if TYPE_CHECKING:
+    from .storage import FileProviderBase, FileReference
+    from .collections import CollectionBase, TimestampedCollectionBase
+    from .identity_map import request_scope
+
+__all__ = ['FileProviderBase', 'CollectionBase', 'TimestampedCollectionBase', 'FileReference',
+           'request_scope']
+
+# Submodule each export lives in; resolved lazily (PEP 562) so importing the
+# collection abstractions does not pull in pydantic via the storage module
+_EXPORTS = {
+    'FileProviderBase': '.storage',
+    'FileReference': '.storage',
+    'CollectionBase': '.collections',
+    'TimestampedCollectionBase': '.collections',
+    'request_scope': '.identity_map',
+}
+
+
+def __getattr__(name: str):
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+    value = getattr(import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,15 +1,50 @@
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Optional, List, Dict, Any, TypeVar, Generic
+from contextlib import asynccontextmanager
+from typing import (
+    Optional, List, Dict, Any, TypeVar, Generic, Callable, Awaitable, ClassVar, FrozenSet,
+    AsyncIterator, Tuple,
+)
 from datetime import datetime
 
 
 # Generic type for collection items
 T = TypeVar('T')
+R = TypeVar('R')
+
+# Number of per-item operations awaited concurrently by the multi_* fallbacks.
+# Bounds memory and keeps a large batch from monopolising the connection pool.
+BATCH_CHUNK_SIZE = 64
+
+
+async def _gather_chunked(func: Callable[..., Awaitable[R]], *arg_lists: List[Any]) -> List[R]:
+    """Run func over aligned argument lists, awaiting each chunk concurrently."""
+    args = list(zip(*arg_lists))
+    results: List[R] = []
+    for start in range(0, len(args), BATCH_CHUNK_SIZE):
+        chunk = args[start:start + BATCH_CHUNK_SIZE]
+        results.extend(await asyncio.gather(*(func(*call_args) for call_args in chunk)))
+    return results
 
 
 class CollectionBase(ABC, Generic[T]):
     """Abstract base class for collection storage providers implementing CRUD operations."""
     
+    # Fields that providers maintain secondary indexes for, so equality filters
+    # on them can be answered without scanning the whole collection. Nested
+    # model fields are named by dotted paths (e.g. "file.provider").
+    INDEXED_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    
+    # Fields whose words providers index for search()
+    SEARCHABLE_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    
+    # Numeric fields that providers keep ordered, so range queries on them
+    # only touch matching items
+    RANGE_INDEXED_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    
+    # Fields whose value distribution providers keep counts of for statistics
+    COUNTED_FIELDS: ClassVar[FrozenSet[str]] = frozenset()
+    
     @abstractmethod
     async def create(self, item: T, item_id: Optional[str] = None) -> str:
         """Create a new item in the collection.
@@ -113,11 +148,13 @@ class CollectionBase(ABC, Generic[T]):
         """
         pass
     
-    # Optional methods with default implementations
-    
+    @abstractmethod
     async def upsert(self, item_id: str, item: T) -> str:
         """Insert or update an item in the collection.
         
+        Implementations must perform the write atomically, so concurrent
+        upserts of the same ID never fail with a duplicate-ID error.
+        
         Args:
             item_id: The ID of the item
             item: The item data
@@ -125,11 +162,52 @@ class CollectionBase(ABC, Generic[T]):
         Returns:
             The ID of the item (same as input)
         """
-        if await self.exists(item_id):
-            await self.update(item_id, item)
-        else:
-            await self.create(item, item_id)
-        return item_id
+        pass
+    
+    # Optional methods with default implementations
+    
+    async def multi_create(self, items: List[T], item_ids: Optional[List[str]] = None) -> List[str]:
+        """Create multiple items, ideally in a single backend round trip.
+        
+        Providers should override this with a bulk operation. The default
+        implementation runs create() concurrently in chunks.
+        
+        Args:
+            items: List of items to create
+            item_ids: Optional list of custom IDs, aligned with items
+            
+        Returns:
+            List of created item IDs, in the same order as items
+        """
+        return await _gather_chunked(self.create, items, item_ids or [None] * len(items))
+    
+    async def multi_read(self, item_ids: List[str]) -> List[Optional[T]]:
+        """Read multiple items, ideally in a single backend round trip.
+        
+        Providers should override this with a bulk operation. The default
+        implementation runs read() concurrently in chunks.
+        
+        Args:
+            item_ids: List of item IDs to retrieve
+            
+        Returns:
+            List of items aligned with item_ids (None where not found)
+        """
+        return await _gather_chunked(self.read, item_ids)
+    
+    async def multi_delete(self, item_ids: List[str]) -> List[bool]:
+        """Delete multiple items, ideally in a single backend round trip.
+        
+        Providers should override this with a bulk operation. The default
+        implementation runs delete() concurrently in chunks.
+        
+        Args:
+            item_ids: List of item IDs to delete
+            
+        Returns:
+            List of deletion flags aligned with item_ids
+        """
+        return await _gather_chunked(self.delete, item_ids)
     
     async def batch_create(self, items: List[T], item_ids: Optional[List[str]] = None) -> List[str]:
         """Create multiple items in the collection.
@@ -147,13 +225,7 @@ class CollectionBase(ABC, Generic[T]):
         if item_ids is not None and len(item_ids) != len(items):
             raise ValueError("item_ids length must match items length")
         
-        created_ids = []
-        for i, item in enumerate(items):
-            item_id = item_ids[i] if item_ids else None
-            created_id = await self.create(item, item_id)
-            created_ids.append(created_id)
-        
-        return created_ids
+        return await self.multi_create(items, item_ids)
     
     async def batch_read(self, item_ids: List[str]) -> Dict[str, Optional[T]]:
         """Read multiple items from the collection.
@@ -164,10 +236,7 @@ class CollectionBase(ABC, Generic[T]):
         Returns:
             Dictionary mapping item IDs to items (None if not found)
         """
-        results = {}
-        for item_id in item_ids:
-            results[item_id] = await self.read(item_id)
-        return results
+        return dict(zip(item_ids, await self.multi_read(item_ids)))
     
     async def batch_delete(self, item_ids: List[str]) -> Dict[str, bool]:
         """Delete multiple items from the collection.
@@ -178,10 +247,7 @@ class CollectionBase(ABC, Generic[T]):
         Returns:
             Dictionary mapping item IDs to deletion success status
         """
-        results = {}
-        for item_id in item_ids:
-            results[item_id] = await self.delete(item_id)
-        return results
+        return dict(zip(item_ids, await self.multi_delete(item_ids)))
     
     async def search(self, query: str, fields: Optional[List[str]] = None, limit: int = 100) -> List[T]:
         """Search for items in the collection.
@@ -202,6 +268,84 @@ class CollectionBase(ABC, Generic[T]):
         _ = query
         _ = fields
         return await self.list(limit=limit)
+    
+    @asynccontextmanager
+    async def open_batch(self) -> AsyncIterator['CollectionBatch[T]']:
+        """Queue several writes and apply them together when the block exits.
+        
+        Example:
+            async with collection.open_batch() as batch:
+                created = batch.create(item)
+                updated = batch.update(other_id, other_item)
+            item_id = await created
+        
+        Yields:
+            A CollectionBatch whose methods return futures resolved on exit
+        """
+        batch = self._create_batch()
+        try:
+            yield batch
+        except BaseException:
+            batch.cancel()
+            raise
+        await batch.execute()
+    
+    def _create_batch(self) -> 'CollectionBatch[T]':
+        """Create the batch used by open_batch(). Providers override this to pipeline writes."""
+        return CollectionBatch(self)
+
+
+class CollectionBatch(Generic[T]):
+    """Writes queued against a collection, applied together by execute().
+    
+    Queued operations run in the order they were added. Each method returns
+    a future that resolves with what the corresponding collection method
+    would have returned, or raises what it would have raised.
+    """
+    
+    def __init__(self, collection: CollectionBase[T]):
+        """Initialize the batch.
+        
+        Args:
+            collection: The collection the writes are applied to
+        """
+        self._collection = collection
+        self._operations: List[Tuple[str, Tuple[Any, ...], asyncio.Future]] = []
+    
+    def create(self, item: T, item_id: Optional[str] = None) -> 'asyncio.Future[str]':
+        """Queue a create; the future resolves with the item ID."""
+        return self._queue('create', item, item_id)
+    
+    def update(self, item_id: str, item: T) -> 'asyncio.Future[bool]':
+        """Queue an update; the future resolves with whether the item existed."""
+        return self._queue('update', item_id, item)
+    
+    def delete(self, item_id: str) -> 'asyncio.Future[bool]':
+        """Queue a delete; the future resolves with whether the item existed."""
+        return self._queue('delete', item_id)
+    
+    def _queue(self, operation: str, *args: Any) -> asyncio.Future:
+        future = asyncio.get_running_loop().create_future()
+        self._operations.append((operation, args, future))
+        return future
+    
+    def _drain(self) -> List[Tuple[str, Tuple[Any, ...], asyncio.Future]]:
+        """Take the queued operations, leaving the batch empty."""
+        operations, self._operations = self._operations, []
+        return operations
+    
+    def cancel(self) -> None:
+        """Discard queued operations and cancel their futures."""
+        for _, _, future in self._drain():
+            future.cancel()
+    
+    async def execute(self) -> None:
+        """Apply the queued operations one after another."""
+        for operation, args, future in self._drain():
+            try:
+                future.set_result(await getattr(self._collection, operation)(*args))
+            except Exception as e:
+                future.set_exception(e)
 
 
 class TimestampedCollectionBase(CollectionBase[T]):
@@ -0,0 +1,51 @@
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Dict, Optional, Tuple
+
+
+# Items loaded during the current request, keyed by (collection_name, item_id).
+# None outside a request scope, which disables the map entirely.
+_IDMAP: ContextVar[Optional[Dict[Tuple[str, str], Any]]] = ContextVar("idmap", default=None)
+
+
+@asynccontextmanager
+async def request_scope() -> AsyncIterator[None]:
+    """Give the enclosed code a fresh identity map.
+    
+    Within the scope every collection read of the same item returns the same
+    instance without going back to the backend. Tasks spawned inside the scope
+    share the map, since they inherit the context it was set in.
+    """
+    token = _IDMAP.set({})
+    try:
+        yield
+    finally:
+        _IDMAP.reset(token)
+
+
+def get_identity(collection_name: str, item_id: str) -> Optional[Any]:
+    """Get the item loaded for an ID in the current scope, if any."""
+    identity_map = _IDMAP.get()
+    if identity_map is None:
+        return None
+    return identity_map.get((collection_name, item_id))
+
+
+def set_identity(collection_name: str, item_id: str, item: Any) -> None:
+    """Remember an item loaded in the current scope."""
+    identity_map = _IDMAP.get()
+    if identity_map is not None:
+        identity_map[(collection_name, item_id)] = item
+
+
+def discard_identities(collection_name: str, *item_ids: str) -> None:
+    """Forget items of a collection in the current scope; all of them if no IDs are given."""
+    identity_map = _IDMAP.get()
+    if not identity_map:
+        return
+    if not item_ids:
+        for key in [key for key in identity_map if key[0] == collection_name]:
+            del identity_map[key]
+        return
+    for item_id in item_ids:
+        identity_map.pop((collection_name, item_id), None)
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import BinaryIO, Optional, List
-from pydantic import BaseModel, Field
+from functools import cached_property
+from typing import AsyncIterator, BinaryIO, Dict, Optional, List
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class FileProviderBase(ABC):
@@ -117,6 +118,69 @@ class FileProviderBase(ABC):
             Download URL if successful, None otherwise
         """
         pass
+    
+    async def get_file_version(self, file_path: str) -> Optional[str]:
+        """Get a marker that changes whenever the file content changes.
+        
+        Providers should override this with cheap metadata such as an ETag
+        or modification time. The default implementation returns None,
+        meaning the version is unknown.
+        
+        Args:
+            file_path: The path of the file
+            
+        Returns:
+            Version marker if known, None otherwise
+        """
+        return None
+    
+    async def save_files(self, files: Dict[str, BinaryIO]) -> Dict[str, bool]:
+        """Save several files to the storage provider.
+        
+        Providers should override this to run transfers concurrently. The
+        default implementation saves the files one by one.
+        
+        Args:
+            files: Mapping of destination paths to binary file data
+            
+        Returns:
+            Mapping of paths to save success status
+        """
+        return {file_path: await self.save_file(file_path, file_data) for file_path, file_data in files.items()}
+    
+    async def get_files(self, file_paths: List[str]) -> Dict[str, Optional[bytes]]:
+        """Retrieve several files from the storage provider.
+        
+        Providers should override this to run transfers concurrently. The
+        default implementation retrieves the files one by one.
+        
+        Args:
+            file_paths: Paths of the files to retrieve
+            
+        Returns:
+            Mapping of paths to file contents (None where not found)
+        """
+        return {file_path: await self.get_file(file_path) for file_path in file_paths}
+    
+    async def get_file_stream(self, file_path: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Stream a file from the storage provider in chunks.
+        
+        Providers should override this to avoid holding the whole file in
+        memory. The default implementation loads the file with get_file()
+        and slices it.
+        
+        Args:
+            file_path: The path of the file to retrieve
+            chunk_size: Maximum size of each yielded chunk in bytes
+            
+        Yields:
+            Consecutive chunks of the file; nothing if the file is not found
+        """
+        content = await self.get_file(file_path)
+        if content is None:
+            return
+        for start in range(0, len(content), chunk_size):
+            yield content[start:start + chunk_size]
 
 
 class FileReference(BaseModel):
@@ -125,17 +189,28 @@ class FileReference(BaseModel):
     provider: str = Field(..., description="Storage provider name (e.g., 'local', 's3')")
     reference: str = Field(..., description="Provider-specific file reference/path")
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        frozen=True,
+        json_schema_extra={
             "example": {
                 "provider": "s3",
                 "reference": "uploads/songs/master_of_puppets.gp5"
             }
         }
+    )
+
+    def __hash__(self) -> int:
+        """Hash on the identifying pair so references can key caches and sets."""
+        return hash((self.provider, self.reference))
+
+    @cached_property
+    def _uri(self) -> str:
+        """Memoized 'provider://reference' form; references are never mutated."""
+        return f"{self.provider}://{self.reference}"
 
     def __str__(self) -> str:
         """String representation of the file reference."""
-        return f"{self.provider}://{self.reference}"
+        return self._uri
 
     def __repr__(self) -> str:
         """Detailed string representation."""
@@ -154,11 +229,11 @@ class FileReference(BaseModel):
         Raises:
             ValueError: If the string format is invalid
         """
-        if '://' not in file_ref:
+        # Single scan for the separator instead of a membership test plus split
+        provider, separator, reference = file_ref.partition('://')
+        if not separator:
             raise ValueError("File reference must be in format 'provider://reference'")
 
-        provider, reference = file_ref.split('://', 1)
-
         if not provider or not reference:
             raise ValueError("Both provider and reference must be non-empty")
 
@@ -1,15 +1,141 @@
-import uuid
-from typing import Optional, List, Dict, Any, TypeVar, Type
-from datetime import datetime
+import asyncio
+import logging
+import os
+import re
+import time
+from typing import Optional, List, Dict, Any, TypeVar, Type, Set, Tuple, Union, Callable, Awaitable
+from datetime import datetime, timedelta, timezone
 import redis.asyncio as redis
+from cachetools import LRUCache, TTLCache
 from pydantic import BaseModel, ValidationError
 
-from api.abstractions.collections import TimestampedCollectionBase
+from api.abstractions.collections import TimestampedCollectionBase, CollectionBatch
+from api.abstractions.identity_map import get_identity, set_identity, discard_identities
 from api.settings.app_settings import settings
 from api.infrastructure.logging import get_logger
+from api.infrastructure.metrics import get_counter
+from api.utils import serialization
 
 T = TypeVar('T', bound=BaseModel)
 
+# Atomically writes an item, registers it in the creation-ordered index when
+# it is new, maintains its timestamps and adds it to the field indexes of the
+# new value. Returns the previous payload (nil if it was new).
+# KEYS: item, index, timestamps, updated, field indexes...
+# ARGV: payload, item_id, now (epoch microseconds), now (epoch seconds).
+_UPSERT_SCRIPT = """
+local old = redis.call('GET', KEYS[1])
+redis.call('SET', KEYS[1], ARGV[1])
+if not old then
+    redis.call('ZADD', KEYS[2], ARGV[4], ARGV[2])
+end
+redis.call('HSETNX', KEYS[3], 'created', ARGV[3])
+redis.call('HSET', KEYS[3], 'updated', ARGV[3])
+redis.call('ZADD', KEYS[4], ARGV[4], ARGV[2])
+for i = 5, #KEYS do
+    redis.call('SADD', KEYS[i], ARGV[2])
+end
+return old
+"""
+
+# Splits text into search tokens
+_TOKEN_SPLIT_PATTERN = re.compile(r"\W+")
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Read cache marker for IDs known to be absent
+_MISSING = object()
+
+# Field index token for None, kept distinct from any real string value
+_NONE_TOKEN = "\x00none"
+
+# Maximum number of indexed words the last word of a prefix search expands to
+SEARCH_PREFIX_EXPANSIONS = 50
+
+# Maximum number of indexed words a word of a substring search expands to
+# before the search falls back to checking every item
+SEARCH_SUBSTRING_EXPANSIONS = 200
+
+# Seconds computed collection statistics are served from Redis
+STATS_CACHE_TTL = 30
+
+# Number of keys removed per UNLINK by clear()
+CLEAR_CHUNK_SIZE = 500
+
+# Version of the index layout; collections indexed with an older one (or
+# written before indexing) are rebuilt once by ensure_indexes()
+INDEX_VERSION = "1"
+
+# Seconds the index rebuild lock is held at most, and how long other
+# processes wait for a rebuild in progress to finish
+INDEX_REBUILD_LOCK_TTL = 600
+INDEX_REBUILD_WAIT = 300
+
+# Reference points for timestamps stored as integer epoch microseconds
+_EPOCH = datetime(1970, 1, 1)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _index_token(value: Any) -> str:
+    """Render a field value as the token used in its secondary index key."""
+    if value is None:
+        return _NONE_TOKEN
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def _tokenize(value: Any) -> Set[str]:
+    """Lowercase word tokens of a field value; lists contribute the tokens of each element."""
+    if value is None:
+        return set()
+    if isinstance(value, (list, tuple, set, frozenset)):
+        tokens: Set[str] = set()
+        for element in value:
+            tokens |= _tokenize(element)
+        return tokens
+    return {token for token in _TOKEN_SPLIT_PATTERN.split(str(value).lower()) if token}
+
+
+def _get_field_value(item: Any, field: str) -> Any:
+    """Resolve a field of an item, following dotted paths into nested models; _MISSING if absent."""
+    value = item
+    for name in field.split('.'):
+        value = getattr(value, name, _MISSING)
+        if value is _MISSING:
+            break
+    return value
+
+
+def _decode(value: Union[bytes, str]) -> str:
+    """Decode a reply value; str replies from a decode_responses client pass through."""
+    return value.decode() if isinstance(value, bytes) else value
+
+
+def _to_epoch_micros(timestamp: datetime) -> int:
+    """Convert a datetime to integer microseconds since the epoch; naive values are treated as UTC."""
+    if timestamp.tzinfo is not None:
+        timestamp = timestamp.astimezone(timezone.utc).replace(tzinfo=None)
+    return (timestamp - _EPOCH) // _MICROSECOND
+
+
+def _parse_timestamp(value: Union[bytes, str]) -> datetime:
+    """Parse a stored timestamp into a naive UTC datetime.
+    
+    Timestamps are stored as epoch microseconds; ISO-8601 strings written
+    by earlier versions are still accepted.
+    """
+    text = _decode(value)
+    if text.isdigit():
+        return _EPOCH + timedelta(microseconds=int(text))
+    return datetime.fromisoformat(text)
+
+
+def _to_score(timestamp: datetime) -> float:
+    """Convert a datetime to a sorted-set score; naive values are treated as UTC."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
 
 class RedisCollectionBase(TimestampedCollectionBase[T]):
     """Redis implementation of CollectionBase for Pydantic models."""
@@ -18,7 +144,9 @@ class RedisCollectionBase(TimestampedCollectionBase[T]):
                  collection_name: str, 
                  model_class: Type[T],
                  redis_client: Optional[redis.Redis] = None,
-                 key_prefix: Optional[str] = None):
+                 key_prefix: Optional[str] = None,
+                 cache_size: int = 1024,
+                 cache_ttl: float = 1.0):
         """Initialize the Redis collection.
         
         Args:
@@ -26,6 +154,8 @@ class RedisCollectionBase(TimestampedCollectionBase[T]):
             model_class: Pydantic model class for type safety and serialization
             redis_client: Optional Redis client. If None, creates from settings.
             key_prefix: Optional custom key prefix. Defaults to collection_name.
+            cache_size: Maximum number of items kept in the local read cache
+            cache_ttl: Seconds a cached item is served before Redis is consulted again
         """
         self.collection_name = collection_name
         self.model_class = model_class
@@ -36,309 +166,1257 @@ class RedisCollectionBase(TimestampedCollectionBase[T]):
         self._redis = redis_client or self._create_redis_client()
         
         # Redis key patterns
-        self._item_key_pattern = f"{self.key_prefix}:item:{{item_id}}"
-        self._timestamp_key_pattern = f"{self.key_prefix}:timestamps:{{item_id}}"
-        self._index_key = f"{self.key_prefix}:index"
-        self._counter_key = f"{self.key_prefix}:counter"
+        self._item_prefix = f"{self.key_prefix}:item:"
+        self._timestamp_prefix = f"{self.key_prefix}:timestamps:"
+        # Sorted set of all item IDs scored by creation time: pages are read with
+        # ZRANGE and the size with ZCARD, so no separate counter is kept
+        self._index_key = f"{self.key_prefix}:created"
+        self._updated_key = f"{self.key_prefix}:updated"
+        self._field_index_prefix = f"{self.key_prefix}:idx:"
+        self._token_index_prefix = f"{self.key_prefix}:tok:"
+        # Sorted set of every indexed token (all scored 0) for prefix lookups
+        self._vocabulary_key = f"{self.key_prefix}:vocab"
+        self._range_index_prefix = f"{self.key_prefix}:rng:"
+        self._stats_prefix = f"{self.key_prefix}:stats:"
+        self._stats_cache_key = f"{self._stats_prefix}cache"
+        # Bumped by every write, so statistics computed meanwhile are not cached
+        self._stats_generation_key = f"{self.key_prefix}:stats_generation"
+        self._index_version_key = f"{self.key_prefix}:index_version"
+        self._index_lock_key = f"{self.key_prefix}:index_lock"
+        # Set once the index layout is known to be current
+        self._indexes_ready = False
+        
+        self._upsert_script = self._redis.register_script(_UPSERT_SCRIPT)
         
-        self.logger.info(f"Initialized RedisCollectionBase for {collection_name} with model {model_class.__name__}")
+        # Short-lived read-through cache; local writes invalidate their entries,
+        # writes from other processes become visible after cache_ttl seconds.
+        # Misses are cached too, so repeated lookups of absent IDs stay local.
+        # Cached instances are shared between callers and must not be mutated.
+        self._cache: TTLCache = TTLCache(maxsize=cache_size, ttl=cache_ttl)
+        self._cache_hits = 0
+        self._cache_misses = 0
+        
+        # Serialized payloads of frozen items keyed by id(); entries hold the item
+        # itself so its id cannot be reused while cached. Items read from Redis are
+        # primed with their raw payload, so writing them back skips re-encoding.
+        self._frozen_items = bool(model_class.model_config.get('frozen'))
+        self._serialized: LRUCache = LRUCache(maxsize=cache_size)
+        
+        # Hot-path activity is counted rather than logged at DEBUG level
+        self._reads = get_counter(f"{collection_name}.reads")
+        self._creates = get_counter(f"{collection_name}.creates")
+        self._deletes = get_counter(f"{collection_name}.deletes")
+        
+        self.logger.info("Initialized RedisCollectionBase for %s with model %s", collection_name, model_class.__name__)
     
     def _create_redis_client(self) -> redis.Redis:
-        """Create a Redis client from settings."""
-        return redis.from_url(
-            settings.redis_url,
-            db=settings.redis_db,
-            decode_responses=True
-        )
+        """Get the Redis client shared by collections created from settings."""
+        return get_redis_client()
     
     def _get_item_key(self, item_id: str) -> str:
         """Get the Redis key for an item."""
-        return self._item_key_pattern.format(item_id=item_id)
+        return self._item_prefix + item_id
     
     def _get_timestamp_key(self, item_id: str) -> str:
         """Get the Redis key for item timestamps."""
-        return self._timestamp_key_pattern.format(item_id=item_id)
+        return self._timestamp_prefix + item_id
     
-    def _generate_id(self) -> str:
-        """Generate a unique ID for new items."""
-        return str(uuid.uuid4())
+    def _get_field_index_key(self, field: str, value: Any) -> str:
+        """Get the Redis key of the secondary index set for a field value."""
+        return f"{self._field_index_prefix}{field}:{_index_token(value)}"
+    
+    def _get_token_index_key(self, token: str) -> str:
+        """Get the Redis key of the inverted index set for a search token."""
+        return f"{self._token_index_prefix}{token}"
     
-    async def _serialize_item(self, item: T) -> str:
-        """Serialize a Pydantic model to JSON string."""
-        return item.model_dump_json()
+    def _get_range_index_key(self, field: str) -> str:
+        """Get the Redis key of the sorted set indexing a numeric field."""
+        return f"{self._range_index_prefix}{field}"
     
-    async def _deserialize_item(self, data: str) -> T:
-        """Deserialize JSON string to Pydantic model."""
+    def _get_stats_key(self, field: str) -> str:
+        """Get the Redis key of the hash counting the values of a field."""
+        return f"{self._stats_prefix}{field}"
+    
+    def _get_item_tokens(self, item: T, fields: Optional[List[str]] = None) -> Set[str]:
+        """Get the search tokens of an item, optionally restricted to some fields."""
+        tokens: Set[str] = set()
+        for field in self.SEARCHABLE_FIELDS if fields is None else fields:
+            tokens |= _tokenize(getattr(item, field, None))
+        return tokens
+    
+    def _get_index_keys(self, item: Optional[T]) -> Set[str]:
+        """Get the secondary and inverted index keys an item belongs to."""
+        if item is None:
+            return set()
+        keys = set()
+        for field in self.INDEXED_FIELDS:
+            value = _get_field_value(item, field)
+            keys.add(self._get_field_index_key(field, None if value is _MISSING else value))
+        keys.update(self._get_token_index_key(token) for token in self._get_item_tokens(item))
+        return keys
+    
+    def _load_indexed_item(self, data: Optional[Union[str, bytes]]) -> Optional[T]:
+        """Deserialize a previous payload only when indexes need it."""
+        if data is None or not (self.INDEXED_FIELDS or self.SEARCHABLE_FIELDS
+                                or self.RANGE_INDEXED_FIELDS or self.COUNTED_FIELDS):
+            return None
         try:
             return self.model_class.model_validate_json(data)
         except ValidationError as e:
-            self.logger.exception(f"Failed to deserialize item: {e}")
+            self.logger.warning("Cannot reindex invalid payload in %s: %s", self.collection_name, e)
+            return None
+    
+    def _queue_index_changes(self, pipe, item_id: str, old_item: Optional[T], new_item: Optional[T]) -> None:
+        """Queue the index updates for replacing old_item with new_item."""
+        old_keys = self._get_index_keys(old_item)
+        new_keys = self._get_index_keys(new_item)
+        for key in old_keys - new_keys:
+            pipe.srem(key, item_id)
+        for key in new_keys - old_keys:
+            pipe.sadd(key, item_id)
+        self._queue_vocabulary(pipe, new_keys - old_keys)
+        self._queue_range_changes(pipe, item_id, old_item, new_item)
+        self._queue_count_changes(pipe, old_item, new_item)
+        self._queue_lookup_changes(pipe, item_id, old_item, new_item)
+    
+    def _queue_lookup_changes(self, pipe, item_id: str, old_item: Optional[T], new_item: Optional[T]) -> None:
+        """Queue updates of collection-specific lookup keys; there are none by default."""
+    
+    def _queue_count_changes(self, pipe, old_item: Optional[T], new_item: Optional[T]) -> None:
+        """Queue the value count updates for replacing old_item with new_item.
+        
+        Also drops the cached statistics, which every write may change, and
+        bumps the statistics generation after the changes they are computed from.
+        """
+        for field in self.COUNTED_FIELDS:
+            old_value = None if old_item is None else _get_field_value(old_item, field)
+            new_value = None if new_item is None else _get_field_value(new_item, field)
+            if old_value == new_value:
+                continue
+            if old_value is not None and old_value is not _MISSING:
+                pipe.hincrby(self._get_stats_key(field), _index_token(old_value), -1)
+            if new_value is not None and new_value is not _MISSING:
+                pipe.hincrby(self._get_stats_key(field), _index_token(new_value), 1)
+        pipe.unlink(self._stats_cache_key)
+        pipe.incr(self._stats_generation_key)
+    
+    def _queue_vocabulary(self, pipe, index_keys: Set[str]) -> None:
+        """Queue adding the tokens of newly used inverted index keys to the vocabulary."""
+        prefix_length = len(self._token_index_prefix)
+        tokens = {key[prefix_length:]: 0 for key in index_keys if key.startswith(self._token_index_prefix)}
+        if tokens:
+            pipe.zadd(self._vocabulary_key, tokens)
+    
+    def _queue_range_changes(self, pipe, item_id: str, old_item: Optional[T], new_item: Optional[T]) -> None:
+        """Queue the range index updates for replacing old_item with new_item."""
+        for field in self.RANGE_INDEXED_FIELDS:
+            old_value = None if old_item is None else _get_field_value(old_item, field)
+            new_value = None if new_item is None else _get_field_value(new_item, field)
+            if new_value is not None and new_value is not _MISSING:
+                if new_value != old_value:
+                    pipe.zadd(self._get_range_index_key(field), {item_id: new_value})
+            elif old_value is not None and old_value is not _MISSING:
+                pipe.zrem(self._get_range_index_key(field), item_id)
+    
+    def _invalidate(self, *item_ids: str) -> None:
+        """Drop cached and request-scoped entries for the given item IDs."""
+        for item_id in item_ids:
+            self._cache.pop(item_id, None)
+        discard_identities(self.collection_name, *item_ids)
+    
+    def cache_stats(self) -> Dict[str, int]:
+        """Get read cache statistics."""
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'size': len(self._cache),
+            'maxsize': int(self._cache.maxsize),
+        }
+    
+    def _generate_id(self) -> str:
+        """Generate a unique, time-ordered ID for new items.
+        
+        Uses the UUIDv7 layout (48-bit millisecond timestamp, version and
+        variant bits, 74 random bits) so IDs sort by creation time.
+        """
+        unix_ms = time.time_ns() // 1_000_000
+        rand = int.from_bytes(os.urandom(10), "big")
+        value = (
+            (unix_ms & 0xFFFF_FFFF_FFFF) << 80
+            | 0x7 << 76
+            | (rand >> 68) << 64
+            | 0b10 << 62
+            | rand & 0x3FFF_FFFF_FFFF_FFFF
+        )
+        # Same text as str(uuid.UUID(int=value)) without constructing a UUID
+        h = f"{value:032x}"
+        return f"{h[:8]}-{h[8:12]}-{h[12:16]}-{h[16:20]}-{h[20:]}"
+    
+    def _serialize_item(self, item: T) -> Union[str, bytes]:
+        """Serialize a Pydantic model to JSON string.
+        
+        Pydantic's Rust JSON encoder is used directly; it outperforms dumping
+        to a dict and encoding that with orjson.
+        """
+        if not self._frozen_items:
+            return item.model_dump_json()
+        
+        entry = self._serialized.get(id(item))
+        if entry is not None and entry[0] is item:
+            return entry[1]
+        
+        data = item.model_dump_json()
+        self._serialized[id(item)] = (item, data)
+        return data
+    
+    def _deserialize_item(self, data: Union[str, bytes]) -> T:
+        """Deserialize a JSON payload to Pydantic model.
+        
+        Parsing and validation happen in a single pass in pydantic-core, which
+        is faster than orjson.loads followed by model_construct for our models.
+        """
+        try:
+            item = self.model_class.model_validate_json(data)
+            if self._frozen_items:
+                self._serialized[id(item)] = (item, data)
+            return item
+        except ValidationError as e:
+            self.logger.exception("Failed to deserialize item: %s", e)
             raise ValueError(f"Invalid data format for {self.model_class.__name__}") from e
     
     async def create(self, item: T, item_id: Optional[str] = None) -> str:
         """Create a new item in the collection."""
+        created_id, _ = await self._create(item, item_id, record_timestamps=False)
+        return created_id
+    
+    async def _create(self, item: T, item_id: Optional[str], record_timestamps: bool) -> Tuple[str, datetime]:
+        """Create an item, optionally writing its timestamps hash in the same pipeline."""
         if item_id is None:
             item_id = self._generate_id()
         
-        self.logger.debug(f"Creating item with ID: {item_id}")
+        self._creates.increment()
         
         item_key = self._get_item_key(item_id)
         
-        # Check if item already exists
-        if await self._redis.exists(item_key):
-            self.logger.error(f"Item with ID {item_id} already exists")
+        # Store the item only if the ID is free; a concurrent create of the
+        # same ID cannot slip in between a check and the write
+        serialized_item = self._serialize_item(item)
+        if not await self._redis.set(item_key, serialized_item, nx=True):
+            self.logger.error("Item with ID %s already exists", item_id)
             raise ValueError(f"Item with ID {item_id} already exists")
         
-        # Serialize and store item
-        serialized_item = await self._serialize_item(item)
+        now = datetime.utcnow()
+        score = _to_score(now)
         
         async with self._redis.pipeline() as pipe:
-            # Store the item
-            pipe.set(item_key, serialized_item)
-            # Add to index
-            pipe.sadd(self._index_key, item_id)
-            # Increment counter
-            pipe.incr(self._counter_key)
+            # Add to index, ordered by creation time
+            pipe.zadd(self._index_key, {item_id: score})
+            # Add to secondary indexes
+            self._queue_index_changes(pipe, item_id, None, item)
+            pipe.zadd(self._updated_key, {item_id: score})
+            if record_timestamps:
+                pipe.hset(self._get_timestamp_key(item_id), mapping={
+                    'created': _to_epoch_micros(now),
+                    'updated': _to_epoch_micros(now)
+                })
             
             await pipe.execute()
         
-        self.logger.info(f"Successfully created item: {item_id}")
-        return item_id
+        self._invalidate(item_id)
+        self.logger.info("Successfully created item: %s", item_id)
+        return item_id, now
     
     async def read(self, item_id: str) -> Optional[T]:
         """Read an item from the collection by ID."""
-        self.logger.debug(f"Reading item: {item_id}")
+        self._reads.increment()
+        
+        known = get_identity(self.collection_name, item_id)
+        if known is not None:
+            return known
+        
+        cached = self._cache.get(item_id)
+        if cached is not None:
+            self._cache_hits += 1
+            if cached is _MISSING:
+                return None
+            set_identity(self.collection_name, item_id, cached)
+            return cached
+        self._cache_misses += 1
         
         item_key = self._get_item_key(item_id)
         data = await self._redis.get(item_key)
         
         if data is None:
-            self.logger.debug(f"Item not found: {item_id}")
+            self._cache[item_id] = _MISSING
             return None
         
         try:
-            item = await self._deserialize_item(data)
-            self.logger.debug(f"Successfully read item: {item_id}")
+            item = self._deserialize_item(data)
+            self._cache[item_id] = item
+            set_identity(self.collection_name, item_id, item)
             return item
         except ValueError as e:
-            self.logger.exception(f"Failed to deserialize item {item_id}: {e}")
+            self.logger.exception("Failed to deserialize item %s: %s", item_id, e)
             return None
     
     async def update(self, item_id: str, item: T) -> bool:
         """Update an existing item in the collection."""
-        self.logger.debug(f"Updating item: {item_id}")
+        return await self._update(item_id, item, record_timestamps=False) is not None
+    
+    async def _update(self, item_id: str, item: T, record_timestamps: bool) -> Optional[datetime]:
+        """Update an item, optionally touching its timestamps hash in the bookkeeping pipeline.
+        
+        Returns:
+            The update time if the item existed, None otherwise
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Updating item: %s", item_id)
         
         item_key = self._get_item_key(item_id)
         
-        # Check if item exists
-        if not await self._redis.exists(item_key):
-            self.logger.warning(f"Item not found for update: {item_id}")
-            return False
+        # Overwrite only if the item exists, getting the previous payload back
+        serialized_item = self._serialize_item(item)
+        old_data = await self._redis.set(item_key, serialized_item, xx=True, get=True)
         
-        # Serialize and update item
-        serialized_item = await self._serialize_item(item)
-        await self._redis.set(item_key, serialized_item)
+        if old_data is None:
+            self.logger.warning("Item not found for update: %s", item_id)
+            return None
         
-        self.logger.info(f"Successfully updated item: {item_id}")
-        return True
+        now = datetime.utcnow()
+        async with self._redis.pipeline(transaction=False) as pipe:
+            self._queue_index_changes(pipe, item_id, self._load_indexed_item(old_data), item)
+            pipe.zadd(self._updated_key, {item_id: _to_score(now)})
+            if record_timestamps:
+                pipe.hset(self._get_timestamp_key(item_id), 'updated', _to_epoch_micros(now))
+            await pipe.execute()
+        self._invalidate(item_id)
+        
+        self.logger.info("Successfully updated item: %s", item_id)
+        return now
+    
+    async def update_fields(self, item_id: str, **fields: Any) -> Optional[T]:
+        """Change some fields of an item, keeping the others as currently stored.
+        
+        The stored payload is read and rewritten under WATCH, so concurrent
+        writes to the same item are never lost; the change is retried if the
+        item is modified in between. The update time is recorded like update()
+        does, and in the timestamps hash of items that have one.
+        
+        Args:
+            item_id: The ID of the item to update
+            **fields: New values of the fields to change
+            
+        Returns:
+            The updated item, or None if the item was not found
+            
+        Raises:
+            ValueError: If a field is unknown or a value is invalid
+        """
+        unknown = set(fields) - set(self.model_class.model_fields)
+        if unknown:
+            raise ValueError(f"Unknown fields for {self.model_class.__name__}: {', '.join(sorted(unknown))}")
+        
+        item_key = self._get_item_key(item_id)
+        timestamp_key = self._get_timestamp_key(item_id)
+        async with self._redis.pipeline() as pipe:
+            while True:
+                try:
+                    await pipe.watch(item_key, timestamp_key)
+                    old_data = await pipe.get(item_key)
+                    if old_data is None:
+                        self.logger.warning("Item not found for update: %s", item_id)
+                        return None
+                    
+                    old_item = self._deserialize_item(old_data)
+                    try:
+                        new_item = self.model_class.model_validate({**old_item.model_dump(), **fields})
+                    except ValidationError as e:
+                        raise ValueError(f"Invalid data format for {self.model_class.__name__}") from e
+                    has_timestamps = await pipe.exists(timestamp_key)
+                    
+                    now = datetime.utcnow()
+                    pipe.multi()
+                    pipe.set(item_key, self._serialize_item(new_item))
+                    self._queue_index_changes(pipe, item_id, old_item, new_item)
+                    pipe.zadd(self._updated_key, {item_id: _to_score(now)})
+                    if has_timestamps:
+                        pipe.hset(timestamp_key, 'updated', _to_epoch_micros(now))
+                    await pipe.execute()
+                    break
+                except redis.WatchError:
+                    continue
+        self._invalidate(item_id)
+        
+        self.logger.info("Successfully updated fields %s of item: %s", ', '.join(sorted(fields)), item_id)
+        return new_item
     
     async def delete(self, item_id: str) -> bool:
         """Delete an item from the collection."""
-        self.logger.debug(f"Deleting item: {item_id}")
+        self._deletes.increment()
         
         item_key = self._get_item_key(item_id)
         timestamp_key = self._get_timestamp_key(item_id)
         
         async with self._redis.pipeline() as pipe:
-            # Delete the item
-            pipe.delete(item_key)
+            # Delete the item, keeping its payload to clean up field indexes
+            pipe.getdel(item_key)
             # Delete timestamps
             pipe.delete(timestamp_key)
-            # Remove from index
-            pipe.srem(self._index_key, item_id)
-            # Decrement counter
-            pipe.decr(self._counter_key)
+            # Remove from indexes
+            pipe.zrem(self._index_key, item_id)
+            pipe.zrem(self._updated_key, item_id)
             
             results = await pipe.execute()
         
-        deleted = results[0] > 0  # Number of keys deleted
+        self._invalidate(item_id)
+        old_data = results[0]
+        deleted = old_data is not None
         
         if deleted:
-            self.logger.info(f"Successfully deleted item: {item_id}")
+            async with self._redis.pipeline(transaction=False) as pipe:
+                self._queue_index_changes(pipe, item_id, self._load_indexed_item(old_data), None)
+                await pipe.execute()
+        
+        if deleted:
+            self.logger.info("Successfully deleted item: %s", item_id)
         else:
-            self.logger.warning(f"Item not found for deletion: {item_id}")
+            self.logger.warning("Item not found for deletion: %s", item_id)
         
         return deleted
     
-    async def list(self, offset: int = 0, limit: int = 100, filters: Optional[Dict[str, Any]] = None) -> List[T]:
-        """List items from the collection with pagination."""
-        self.logger.debug(f"Listing items with offset={offset}, limit={limit}")
+    async def upsert(self, item_id: str, item: T) -> str:
+        """Insert or update an item atomically in a single round trip."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Upserting item: %s", item_id)
+        
+        serialized_item = self._serialize_item(item)
+        new_index_keys = self._get_index_keys(item)
+        now = datetime.utcnow()
+        old_data = await self._upsert_script(
+            keys=[
+                self._get_item_key(item_id),
+                self._index_key,
+                self._get_timestamp_key(item_id),
+                self._updated_key,
+                *new_index_keys,
+            ],
+            args=[serialized_item, item_id, _to_epoch_micros(now), _to_score(now)],
+        )
+        
+        # The script already added the new field index entries; drop stale ones
+        # and bring the range indexes up to date
+        old_item = self._load_indexed_item(old_data)
+        old_index_keys = self._get_index_keys(old_item)
+        stale_keys = old_index_keys - new_index_keys
+        added_keys = new_index_keys - old_index_keys
+        if stale_keys or added_keys or self.RANGE_INDEXED_FIELDS or self.COUNTED_FIELDS:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key in stale_keys:
+                    pipe.srem(key, item_id)
+                self._queue_vocabulary(pipe, added_keys)
+                self._queue_range_changes(pipe, item_id, old_item, item)
+                self._queue_count_changes(pipe, old_item, item)
+                self._queue_lookup_changes(pipe, item_id, old_item, item)
+                await pipe.execute()
+        self._invalidate(item_id)
+        
+        self.logger.info("Successfully %s item: %s", 'updated' if old_data is not None else 'created', item_id)
+        return item_id
+    
+    async def multi_create(self, items: List[T], item_ids: Optional[List[str]] = None) -> List[str]:
+        """Create multiple items using a single MSETNX plus one pipeline."""
+        if not items:
+            return []
+        
+        if item_ids is None:
+            item_ids = [self._generate_id() for _ in items]
+        
+        if len(set(item_ids)) != len(item_ids):
+            raise ValueError("Duplicate item IDs in batch")
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Creating %s items", len(items))
+        
+        mapping = {}
+        for item_id, item in zip(item_ids, items):
+            mapping[self._get_item_key(item_id)] = self._serialize_item(item)
+        
+        # MSETNX is all-or-nothing, so a single existing ID rejects the whole batch
+        if not await self._redis.msetnx(mapping):
+            self.logger.error("One or more items in batch already exist")
+            raise ValueError("One or more items in batch already exist")
+        
+        score = _to_score(datetime.utcnow())
+        scores = {item_id: score for item_id in item_ids}
         
-        # Get all item IDs from the index
-        all_item_ids = await self._redis.smembers(self._index_key)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.zadd(self._index_key, scores)
+            for item_id, item in zip(item_ids, items):
+                self._queue_index_changes(pipe, item_id, None, item)
+            pipe.zadd(self._updated_key, scores)
+            await pipe.execute()
         
-        # Apply pagination
-        item_ids = list(all_item_ids)[offset:offset + limit]
+        self._invalidate(*item_ids)
         
+        self.logger.info("Successfully created %s items", len(item_ids))
+        return list(item_ids)
+    
+    async def multi_read(self, item_ids: List[str]) -> List[Optional[T]]:
+        """Read multiple items with a single MGET."""
         if not item_ids:
             return []
         
-        # Batch read items
-        items = []
-        for item_id in item_ids:
-            item = await self.read(item_id)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Reading %s items", len(item_ids))
+        
+        cached = [get_identity(self.collection_name, item_id) or self._cache.get(item_id)
+                  for item_id in item_ids]
+        missing = [i for i, item in enumerate(cached) if item is None]
+        items: List[Optional[T]] = [None if item is _MISSING else item for item in cached]
+        self._cache_hits += len(item_ids) - len(missing)
+        self._cache_misses += len(missing)
+        for item_id, item in zip(item_ids, items):
             if item is not None:
-                # Apply filters if provided
-                if filters is None or self._matches_filters(item, filters):
-                    items.append(item)
+                set_identity(self.collection_name, item_id, item)
+        if not missing:
+            return items
+        
+        values = await self._redis.mget([self._get_item_key(item_ids[i]) for i in missing])
         
-        self.logger.debug(f"Found {len(items)} items")
+        for i, data in zip(missing, values):
+            if data is None:
+                self._cache[item_ids[i]] = _MISSING
+                continue
+            try:
+                item = self._deserialize_item(data)
+            except ValueError as e:
+                self.logger.exception("Failed to deserialize item %s: %s", item_ids[i], e)
+                continue
+            self._cache[item_ids[i]] = item
+            set_identity(self.collection_name, item_ids[i], item)
+            items[i] = item
+        return items
+    
+    async def multi_delete(self, item_ids: List[str]) -> List[bool]:
+        """Delete multiple items with a single pipeline."""
+        if not item_ids:
+            return []
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Deleting %s items", len(item_ids))
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for item_id in item_ids:
+                pipe.getdel(self._get_item_key(item_id))
+            pipe.delete(*[self._get_timestamp_key(item_id) for item_id in item_ids])
+            pipe.zrem(self._index_key, *item_ids)
+            pipe.zrem(self._updated_key, *item_ids)
+            results = await pipe.execute()
+        
+        self._invalidate(*item_ids)
+        old_payloads = results[:len(item_ids)]
+        deleted = [data is not None for data in old_payloads]
+        deleted_count = sum(deleted)
+        
+        # Only clean up field indexes of items that actually existed
+        if deleted_count:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for item_id, data in zip(item_ids, old_payloads):
+                    if data is not None:
+                        self._queue_index_changes(pipe, item_id, self._load_indexed_item(data), None)
+                await pipe.execute()
+        
+        self.logger.info("Successfully deleted %s of %s items", deleted_count, len(item_ids))
+        return deleted
+    
+    async def list(self, offset: int = 0, limit: int = 100, filters: Optional[Dict[str, Any]] = None) -> List[T]:
+        """List items from the collection with pagination."""
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Listing items with offset=%s, limit=%s", offset, limit)
+        await self._require_indexes()
+        
+        if not filters:
+            # Only the requested page of IDs is read from the creation-ordered index
+            page_ids = await self._redis.zrange(self._index_key, offset, offset + limit - 1) if limit > 0 else []
+            items = [item for item in await self.multi_read(list(map(_decode, page_ids))) if item is not None]
+        elif self._is_fully_indexed(filters):
+            # The index already narrowed the IDs, so paginate before hydrating.
+            # Filters are still checked to drop entries that went stale mid-write.
+            candidate_ids = await self._get_candidate_ids(filters)
+            page = await self.multi_read(candidate_ids[offset:offset + limit])
+            items = [item for item in page if item is not None and self._matches_filters(item, filters)]
+        else:
+            candidate_ids = await self._get_candidate_ids(filters)
+            items = await self._scan_filtered(candidate_ids, filters, offset, limit)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Found %s items", len(items))
+        return items
+    
+    def _is_fully_indexed(self, filters: Dict[str, Any]) -> bool:
+        """Check whether there are filters and every filter field has a secondary index."""
+        return bool(filters) and all(field in self.INDEXED_FIELDS for field in filters)
+    
+    async def _get_candidate_ids(self, filters: Optional[Dict[str, Any]]) -> List[str]:
+        """Get the IDs that may match filters, narrowed by field indexes, in a stable order."""
+        index_keys = [
+            self._get_field_index_key(field, value)
+            for field, value in (filters or {}).items()
+            if field in self.INDEXED_FIELDS
+        ]
+        if index_keys:
+            return sorted(map(_decode, await self._redis.sinter(index_keys)))
+        return list(map(_decode, await self._redis.zrange(self._index_key, 0, -1)))
+    
+    async def _scan_filtered(self, candidate_ids: List[str], filters: Dict[str, Any],
+                             offset: int, limit: int) -> List[T]:
+        """Hydrate candidates in chunks, applying filters before pagination."""
+        items: List[T] = []
+        skipped = 0
+        chunk_size = max(limit, 100)
+        for start in range(0, len(candidate_ids), chunk_size):
+            for item in await self.multi_read(candidate_ids[start:start + chunk_size]):
+                if item is None or not self._matches_filters(item, filters):
+                    continue
+                if skipped < offset:
+                    skipped += 1
+                    continue
+                items.append(item)
+                if len(items) >= limit:
+                    return items
         return items
     
     def _matches_filters(self, item: T, filters: Dict[str, Any]) -> bool:
         """Check if an item matches the given filters."""
         for field, value in filters.items():
-            if hasattr(item, field):
-                item_value = getattr(item, field)
-                if item_value != value:
-                    return False
-            else:
+            item_value = _get_field_value(item, field)
+            if item_value is _MISSING or item_value != value:
                 return False
         return True
     
     async def count(self, filters: Optional[Dict[str, Any]] = None) -> int:
         """Count the number of items in the collection."""
-        if filters is None:
-            # Use the counter for efficiency
-            count = await self._redis.get(self._counter_key)
-            return int(count) if count else 0
+        await self._require_indexes()
+        if not filters:
+            return await self._redis.zcard(self._index_key)
         
-        # For filtered count, we need to check each item
+        if self._is_fully_indexed(filters):
+            index_keys = [self._get_field_index_key(field, value) for field, value in filters.items()]
+            return await self._redis.sintercard(len(index_keys), index_keys)
+        
+        # For filtered count on non-indexed fields, we need to check each item
         items = await self.list(limit=10000, filters=filters)  # Large limit for counting
         return len(items)
     
     async def exists(self, item_id: str) -> bool:
         """Check if an item exists in the collection."""
+        cached = self._cache.get(item_id)
+        if cached is not None:
+            self._cache_hits += 1
+            return cached is not _MISSING
+        self._cache_misses += 1
+        
         item_key = self._get_item_key(item_id)
         exists = await self._redis.exists(item_key)
-        self.logger.debug(f"Item {'exists' if exists else 'does not exist'}: {item_id}")
+        if not exists:
+            self._cache[item_id] = _MISSING
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Item %s: %s", 'exists' if exists else 'does not exist', item_id)
         return bool(exists)
     
     async def clear(self) -> bool:
         """Clear all items from the collection."""
-        self.logger.warning(f"Clearing all items from collection: {self.collection_name}")
+        self.logger.warning("Clearing all items from collection: %s", self.collection_name)
+        self._cache.clear()
+        discard_identities(self.collection_name)
         
         try:
-            # Get all item IDs
-            all_item_ids = await self._redis.smembers(self._index_key)
-            
-            if all_item_ids:
-                # Build list of all keys to delete
+            # Items only listed under legacy keys would be missed by the walk
+            await self._require_indexes()
+            # Walk the index a chunk at a time, unlinking item and timestamp keys;
+            # UNLINK frees memory in the background instead of blocking Redis
+            start = 0
+            while True:
+                item_ids = await self._redis.zrange(self._index_key, start, start + CLEAR_CHUNK_SIZE - 1)
+                if not item_ids:
+                    break
                 keys_to_delete = []
-                for item_id in all_item_ids:
+                for item_id in map(_decode, item_ids):
                     keys_to_delete.append(self._get_item_key(item_id))
                     keys_to_delete.append(self._get_timestamp_key(item_id))
-                
-                # Add index and counter keys
-                keys_to_delete.extend([self._index_key, self._counter_key])
-                
-                # Delete all keys
-                await self._redis.delete(*keys_to_delete)
-            else:
-                # Just delete index and counter
-                await self._redis.delete(self._index_key, self._counter_key)
+                await self._redis.unlink(*keys_to_delete)
+                start += CLEAR_CHUNK_SIZE
             
-            self.logger.info(f"Successfully cleared collection: {self.collection_name}")
+            # Drop secondary and inverted indexes in chunks as they are scanned
+            index_keys = []
+            for prefix in (self._field_index_prefix, self._token_index_prefix,
+                           self._range_index_prefix, self._stats_prefix):
+                async for key in self._redis.scan_iter(match=f"{prefix}*", count=CLEAR_CHUNK_SIZE):
+                    index_keys.append(key)
+                    if len(index_keys) >= CLEAR_CHUNK_SIZE:
+                        await self._redis.unlink(*index_keys)
+                        index_keys = []
+            await self._redis.unlink(self._index_key, self._updated_key, self._vocabulary_key,
+                                     self._index_version_key, self._stats_generation_key, *index_keys)
+            
+            self.logger.info("Successfully cleared collection: %s", self.collection_name)
             return True
         
         except Exception as e:
-            self.logger.exception(f"Failed to clear collection: {e}")
+            self.logger.exception("Failed to clear collection: %s", e)
             return False
     
     # Timestamp-related methods
     
     async def create_with_timestamps(self, item: T, item_id: Optional[str] = None) -> tuple[str, datetime]:
-        """Create an item with automatic timestamp tracking."""
-        created_id = await self.create(item, item_id)
-        
-        # Add timestamps
-        now = datetime.utcnow()
-        timestamp_key = self._get_timestamp_key(created_id)
-        
-        timestamps = {
-            'created': now.isoformat(),
-            'updated': now.isoformat()
-        }
-        
-        await self._redis.hset(timestamp_key, mapping=timestamps)
-        
-        return created_id, now
+        """Create an item with automatic timestamp tracking, in the create pipeline."""
+        return await self._create(item, item_id, record_timestamps=True)
     
     async def update_with_timestamps(self, item_id: str, item: T) -> Optional[datetime]:
-        """Update an item with automatic timestamp tracking."""
-        success = await self.update(item_id, item)
-        
-        if not success:
-            return None
-        
-        # Update timestamp
-        now = datetime.utcnow()
-        timestamp_key = self._get_timestamp_key(item_id)
-        
-        await self._redis.hset(timestamp_key, 'updated', now.isoformat())
-        
-        return now
+        """Update an item with automatic timestamp tracking, in the update pipeline."""
+        return await self._update(item_id, item, record_timestamps=True)
     
     async def get_timestamps(self, item_id: str) -> Optional[Dict[str, datetime]]:
         """Get timestamp information for an item."""
-        if not await self.exists(item_id):
-            return None
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.exists(self._get_item_key(item_id))
+            pipe.hgetall(self._get_timestamp_key(item_id))
+            exists, timestamps_raw = await pipe.execute()
         
-        timestamp_key = self._get_timestamp_key(item_id)
-        timestamps_raw = await self._redis.hgetall(timestamp_key)
-        
-        if not timestamps_raw:
+        if not exists or not timestamps_raw:
             return None
         
         try:
             timestamps = {}
             for key, value in timestamps_raw.items():
-                timestamps[key] = datetime.fromisoformat(value)
+                timestamps[_decode(key)] = _parse_timestamp(value)
             return timestamps
         except ValueError as e:
-            self.logger.exception(f"Invalid timestamp format for item {item_id}: {e}")
+            self.logger.exception("Invalid timestamp format for item %s: %s", item_id, e)
             return None
     
+    async def list_by_created_date(self,
+                                   start_date: Optional[datetime] = None,
+                                   end_date: Optional[datetime] = None,
+                                   limit: int = 100) -> List[T]:
+        """List items created within a date range using the creation time index."""
+        return await self._list_by_score(self._index_key, start_date, end_date, limit)
+    
+    async def list_by_updated_date(self,
+                                   start_date: Optional[datetime] = None,
+                                   end_date: Optional[datetime] = None,
+                                   limit: int = 100) -> List[T]:
+        """List items updated within a date range using the update time index."""
+        return await self._list_by_score(self._updated_key, start_date, end_date, limit)
+    
+    async def _list_by_score(self, key: str, start_date: Optional[datetime],
+                             end_date: Optional[datetime], limit: int) -> List[T]:
+        """Hydrate the items of a time index whose scores fall within a date range."""
+        await self._require_indexes()
+        min_score: Union[float, str] = _to_score(start_date) if start_date else "-inf"
+        max_score: Union[float, str] = _to_score(end_date) if end_date else "+inf"
+        item_ids = await self._redis.zrangebyscore(key, min_score, max_score, start=0, num=limit)
+        return [item for item in await self.multi_read(list(map(_decode, item_ids))) if item is not None]
+    
+    async def list_by_range(self,
+                            field: str,
+                            min_value: Optional[float] = None,
+                            max_value: Optional[float] = None,
+                            limit: int = 100) -> List[T]:
+        """List items whose value of a range-indexed field lies within bounds (inclusive).
+        
+        Args:
+            field: A field listed in RANGE_INDEXED_FIELDS
+            min_value: Optional lower bound
+            max_value: Optional upper bound
+            limit: Maximum number of items to return
+            
+        Returns:
+            Matching items ordered by the field value
+            
+        Raises:
+            ValueError: If the field has no range index
+        """
+        if field not in self.RANGE_INDEXED_FIELDS:
+            raise ValueError(f"Field {field} is not range indexed in {self.collection_name}")
+        
+        await self._require_indexes()
+        min_score: Union[float, str] = "-inf" if min_value is None else min_value
+        max_score: Union[float, str] = "+inf" if max_value is None else max_value
+        item_ids = await self._redis.zrangebyscore(
+            self._get_range_index_key(field), min_score, max_score, start=0, num=limit
+        )
+        return [item for item in await self.multi_read(list(map(_decode, item_ids))) if item is not None]
+    
+    async def get_value_counts(self, *fields: str) -> Dict[str, Dict[str, int]]:
+        """Get how many items hold each value of counted fields, in one round trip.
+        
+        Args:
+            fields: Fields listed in COUNTED_FIELDS
+            
+        Returns:
+            Dictionary mapping each field to its value counts; values are
+            rendered as strings and values no item holds are left out
+            
+        Raises:
+            ValueError: If a field is not counted
+        """
+        for field in fields:
+            if field not in self.COUNTED_FIELDS:
+                raise ValueError(f"Field {field} is not counted in {self.collection_name}")
+        await self._require_indexes()
+        
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for field in fields:
+                pipe.hgetall(self._get_stats_key(field))
+            results = await pipe.execute()
+        
+        return {
+            field: {_decode(value): int(count) for value, count in counts.items() if int(count) > 0}
+            for field, counts in zip(fields, results)
+        }
+    
+    async def _get_cached_statistics(self, compute: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Get statistics from Redis, computing and caching them when absent.
+        
+        Writes drop the cached statistics and they expire after STATS_CACHE_TTL
+        seconds. Statistics are only cached if no write landed while they were
+        computed. They are stored as JSON, so dictionary keys must be strings.
+        
+        Args:
+            compute: Coroutine function computing the statistics
+            
+        Returns:
+            Dictionary with the statistics
+        """
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.get(self._stats_cache_key)
+            pipe.get(self._stats_generation_key)
+            cached, generation = await pipe.execute()
+        if cached is not None:
+            return serialization.loads(cached)
+        
+        stats = await compute()
+        async with self._redis.pipeline() as pipe:
+            try:
+                await pipe.watch(self._stats_generation_key)
+                if await pipe.get(self._stats_generation_key) == generation:
+                    pipe.multi()
+                    pipe.set(self._stats_cache_key, serialization.dumps(stats), ex=STATS_CACHE_TTL)
+                    await pipe.execute()
+            except redis.WatchError:
+                # A write landed after the check, so these statistics may already be stale
+                pass
+        return stats
+    
+    async def ensure_indexes(self, wait: bool = True) -> int:
+        """Rebuild the indexes once if they predate the current index layout.
+        
+        Items written before the creation-ordered index existed are only
+        listed under the legacy keys, and before the field and token indexes
+        existed they are not indexed at all. The first process to find the
+        stored index version outdated rebuilds the indexes under a lock.
+        Call this at startup; the index readers also call it, without
+        waiting, until the indexes are known to be current.
+        
+        Args:
+            wait: Whether to wait up to INDEX_REBUILD_WAIT seconds for a rebuild
+                running in another process instead of raising
+        
+        Returns:
+            Number of items indexed by this call (0 if nothing was rebuilt)
+            
+        Raises:
+            RuntimeError: If another process is rebuilding the indexes and wait is False
+        """
+        if self._indexes_ready:
+            return 0
+        if await self._is_index_current():
+            self._indexes_ready = True
+            return 0
+        
+        if not await self._redis.set(self._index_lock_key, os.getpid(), nx=True, ex=INDEX_REBUILD_LOCK_TTL):
+            # Another process is rebuilding; never serve partial indexes
+            if not wait:
+                raise RuntimeError(f"Indexes of collection {self.collection_name} are being rebuilt, retry later")
+            deadline = time.monotonic() + INDEX_REBUILD_WAIT
+            while time.monotonic() < deadline:
+                await asyncio.sleep(0.5)
+                if await self._is_index_current():
+                    self._indexes_ready = True
+                    return 0
+            self.logger.warning("Timed out waiting for the index rebuild of collection: %s", self.collection_name)
+            return 0
+        
+        try:
+            indexed = await self.rebuild_indexes()
+            await self._redis.set(self._index_version_key, INDEX_VERSION)
+        finally:
+            await self._redis.delete(self._index_lock_key)
+        self._indexes_ready = True
+        return indexed
+    
+    async def _is_index_current(self) -> bool:
+        """Check whether the stored index version is the current one."""
+        version = await self._redis.get(self._index_version_key)
+        return version is not None and _decode(version) == INDEX_VERSION
+    
+    async def _require_indexes(self) -> None:
+        """Make sure the indexes are current before reading them."""
+        if not self._indexes_ready:
+            await self.ensure_indexes(wait=False)
+    
+    async def rebuild_indexes(self, batch_size: int = 500) -> int:
+        """Rebuild the ID, time and field indexes from the stored items.
+        
+        Use this once for data written before indexing was introduced.
+        Creation and update times are taken from the timestamps hash when present.
+        
+        Args:
+            batch_size: Number of items processed per round trip
+            
+        Returns:
+            Number of items indexed
+        """
+        self.logger.info("Rebuilding indexes for collection: %s", self.collection_name)
+        
+        item_key_prefix = self._item_prefix
+        keys = [_decode(key) async for key in self._redis.scan_iter(match=f"{item_key_prefix}*", count=batch_size)]
+        now_score = _to_score(datetime.utcnow())
+        indexed = 0
+        
+        # Value counts are increments rather than set members, so start them over
+        if self.COUNTED_FIELDS:
+            await self._redis.delete(*(self._get_stats_key(field) for field in self.COUNTED_FIELDS))
+        
+        for start in range(0, len(keys), batch_size):
+            batch_keys = keys[start:start + batch_size]
+            item_ids = [key[len(item_key_prefix):] for key in batch_keys]
+            
+            async with self._redis.pipeline(transaction=False) as pipe:
+                pipe.mget(batch_keys)
+                for item_id in item_ids:
+                    pipe.hmget(self._get_timestamp_key(item_id), 'created', 'updated')
+                results = await pipe.execute()
+            
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for item_id, data, (created, updated) in zip(item_ids, results[0], results[1:]):
+                    if data is None:
+                        continue
+                    self._queue_index_changes(pipe, item_id, None, self._load_indexed_item(data))
+                    created_score = _to_score(_parse_timestamp(created)) if created else now_score
+                    updated_score = _to_score(_parse_timestamp(updated)) if updated else created_score
+                    pipe.zadd(self._index_key, {item_id: created_score})
+                    pipe.zadd(self._updated_key, {item_id: updated_score})
+                    indexed += 1
+                await pipe.execute()
+        
+        # Drop keys of the set-based index and counter used before the creation index
+        await self._redis.delete(f"{self.key_prefix}:index", f"{self.key_prefix}:counter")
+        self.logger.info("Rebuilt indexes for %s items in collection: %s", indexed, self.collection_name)
+        return indexed
+    
     async def search(self, query: str, fields: Optional[List[str]] = None, limit: int = 100) -> List[T]:
         """Search for items in the collection.
         
-        Note: This is a basic implementation that searches in serialized JSON.
-        For better performance, consider using Redis Search or external search engines.
+        Collections that declare SEARCHABLE_FIELDS are searched through an
+        inverted index: an item matches when it contains every word of the
+        query (case-insensitive). Other collections fall back to a substring
+        scan of the serialized JSON.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Searching for query: %s", query)
+        await self._require_indexes()
+        
+        if self.SEARCHABLE_FIELDS:
+            matching_items = await self._search_tokens(query, fields, limit)
+        else:
+            matching_items = await self._search_scan(query, limit)
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Found %s matching items", len(matching_items))
+        return matching_items
+    
+    async def search_prefix(self, query: str, fields: Optional[List[str]] = None, limit: int = 100) -> List[T]:
+        """Search as the user types: the last word of the query may be incomplete.
+        
+        Matches items containing every complete word of the query and a word
+        starting with its last word, e.g. "master of pup" finds "Master of Puppets".
+        The last word is expanded to at most SEARCH_PREFIX_EXPANSIONS indexed words.
+        
+        Args:
+            query: Search query string
+            fields: Optional list of searchable fields to match in
+            limit: Maximum number of results to return
+            
+        Returns:
+            List of matching items
         """
-        self.logger.debug(f"Searching for query: {query}")
+        words = [word for word in _TOKEN_SPLIT_PATTERN.split(query.lower()) if word]
+        if not self.SEARCHABLE_FIELDS or not words or not query[-1:].isalnum():
+            return await self.search(query, fields, limit)
+        
+        await self._require_indexes()
+        *complete, partial = words
+        complete_tokens = set(complete)
+        # The upper bound is raw bytes: a str "\xff" would go out UTF-8 encoded
+        # and sort below tokens continuing with a character above U+00FF
+        upper_bound = b"[" + partial.encode() + b"\xff"
+        expansions = [
+            _decode(token) for token in await self._redis.zrangebylex(
+                self._vocabulary_key, f"[{partial}", upper_bound, start=0, num=SEARCH_PREFIX_EXPANSIONS
+            )
+        ]
+        if not expansions:
+            return []
+        
+        def matches(item: T) -> bool:
+            if fields is None:
+                return True
+            item_tokens = self._get_item_tokens(item, fields)
+            return complete_tokens <= item_tokens and any(token.startswith(partial) for token in item_tokens)
+        
+        return await self._find_by_tokens(
+            [complete_tokens | {expansion} for expansion in expansions], matches, limit
+        )
+    
+    async def _search_tokens(self, query: str, fields: Optional[List[str]], limit: int) -> List[T]:
+        """Intersect the inverted index sets of the query tokens and hydrate the matches."""
+        query_tokens = _tokenize(query)
+        if not query_tokens:
+            return await self.list(limit=limit)
+        
+        # The index spans all searchable fields; narrow to the requested ones
+        if fields is None:
+            return await self._find_by_tokens([query_tokens], lambda item: True, limit)
+        return await self._find_by_tokens(
+            [query_tokens], lambda item: query_tokens <= self._get_item_tokens(item, fields), limit
+        )
+    
+    async def _find_by_tokens(self, token_sets: List[Set[str]], predicate: Callable[[T], bool],
+                              limit: int) -> List[T]:
+        """Hydrate items indexed under all tokens of any of the token sets and keep those matching predicate.
+        
+        An empty token set cannot narrow anything, so it makes every item a candidate.
+        """
+        await self._require_indexes()
+        if not token_sets or not all(token_sets):
+            candidate_ids = list(map(_decode, await self._redis.zrange(self._index_key, 0, -1)))
+        else:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for tokens in token_sets:
+                    pipe.sinter([self._get_token_index_key(token) for token in tokens])
+                results = await pipe.execute()
+            candidate_ids = sorted({_decode(item_id) for item_ids in results for item_id in item_ids})
+        
+        return await self._hydrate_matching(candidate_ids, predicate, limit)
+    
+    async def _find_by_substring(self, query: str, predicate: Callable[[T], bool], limit: int) -> List[T]:
+        """Hydrate items whose indexed words can contain query and keep those matching predicate.
+        
+        Each word of the query is expanded through the vocabulary to the indexed
+        words it can be part of: a word between two others must be indexed as is,
+        the last one may start a longer word, the first one may end one and a
+        single word may fall anywhere inside one. Words expanding to more than
+        SEARCH_SUBSTRING_EXPANSIONS indexed words make every item a candidate.
+        """
+        await self._require_indexes()
+        lowered = query.lower()
+        words = list(_TOKEN_PATTERN.finditer(lowered))
+        if not self.SEARCHABLE_FIELDS or not words:
+            return await self._find_by_tokens([], predicate, limit)
+        
+        expansions = []
+        for word in words:
+            word_expansions = await self._expand_word(word.group(), word.start() > 0, word.end() < len(lowered))
+            if word_expansions is None:
+                return await self._find_by_tokens([], predicate, limit)
+            if not word_expansions:
+                return []
+            expansions.append(word_expansions)
         
-        # Get all items and search in their serialized form
-        all_item_ids = await self._redis.smembers(self._index_key)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for word_expansions in expansions:
+                pipe.sunion([self._get_token_index_key(token) for token in word_expansions])
+            results = await pipe.execute()
+        candidate_ids = set(map(_decode, results[0])).intersection(*(map(_decode, ids) for ids in results[1:]))
+        return await self._hydrate_matching(sorted(candidate_ids), predicate, limit)
+    
+    async def _expand_word(self, word: str, starts_word: bool, ends_word: bool) -> Optional[List[str]]:
+        """Get the indexed words a query word can be part of; None if there are too many."""
+        if starts_word and ends_word:
+            return [word]
+        if starts_word:
+            # The upper bound is raw bytes, see search_prefix()
+            expansions = [
+                _decode(token) for token in await self._redis.zrangebylex(
+                    self._vocabulary_key, f"[{word}", b"[" + word.encode() + b"\xff",
+                    start=0, num=SEARCH_SUBSTRING_EXPANSIONS + 1
+                )
+            ]
+        else:
+            # Tokens are word characters only, so they never contain glob metacharacters
+            pattern = f"*{word}" if ends_word else f"*{word}*"
+            expansions = []
+            async for token, _ in self._redis.zscan_iter(self._vocabulary_key, match=pattern, count=1000):
+                expansions.append(_decode(token))
+                if len(expansions) > SEARCH_SUBSTRING_EXPANSIONS:
+                    break
+        return expansions if len(expansions) <= SEARCH_SUBSTRING_EXPANSIONS else None
+    
+    async def _hydrate_matching(self, candidate_ids: List[str], predicate: Callable[[T], bool],
+                                limit: int) -> List[T]:
+        """Read candidates in chunks and keep up to limit of those matching predicate."""
+        matching_items: List[T] = []
+        chunk_size = max(limit, 100)
+        for start in range(0, len(candidate_ids), chunk_size):
+            for item in await self.multi_read(candidate_ids[start:start + chunk_size]):
+                if item is not None and predicate(item):
+                    matching_items.append(item)
+                    if len(matching_items) >= limit:
+                        return matching_items
+        return matching_items
+    
+    async def _search_scan(self, query: str, limit: int) -> List[T]:
+        """Substring search over the serialized items, fetched in MGET chunks."""
+        all_item_ids = list(map(_decode, await self._redis.zrange(self._index_key, 0, -1)))
+        needle = query.lower()
+        chunk_size = max(limit, 100)
         matching_items = []
         
-        for item_id in all_item_ids:
-            if len(matching_items) >= limit:
-                break
-                
-            item_key = self._get_item_key(item_id)
-            data = await self._redis.get(item_key)
+        for start in range(0, len(all_item_ids), chunk_size):
+            chunk = all_item_ids[start:start + chunk_size]
+            values = await self._redis.mget([self._get_item_key(item_id) for item_id in chunk])
             
-            if data and query.lower() in data.lower():
+            for data in values:
+                if not data or needle not in _decode(data).lower():
+                    continue
                 try:
-                    item = await self._deserialize_item(data)
-                    matching_items.append(item)
+                    matching_items.append(self._deserialize_item(data))
                 except ValueError:
                     continue
+                if len(matching_items) >= limit:
+                    return matching_items
         
-        self.logger.debug(f"Found {len(matching_items)} matching items")
         return matching_items
     
+    def _create_batch(self) -> 'RedisCollectionBatch[T]':
+        """Create a batch that applies queued writes in two pipelines."""
+        return RedisCollectionBatch(self)
+    
     async def close(self):
         """Close the Redis connection."""
         await self._redis.close()
-        self.logger.info(f"Closed Redis connection for collection: {self.collection_name}")
\ No newline at end of file
+        self.logger.info("Closed Redis connection for collection: %s", self.collection_name)
+
+
+# Global Redis client instance, shared so all collections use one connection pool
+_redis_client: Optional[redis.Redis] = None
+
+
+def get_redis_client() -> redis.Redis:
+    """Get the global Redis client created from settings.
+    
+    Getters run synchronously on the event loop, so concurrent callers
+    cannot interleave here and only one client is ever created.
+    """
+    global _redis_client
+    
+    if _redis_client is None:
+        # Replies stay as bytes: payloads go straight to pydantic's JSON parser
+        # and only IDs and timestamps are decoded. Replies are parsed by hiredis
+        # when it is installed, which redis-py selects automatically.
+        _redis_client = redis.from_url(
+            settings.redis_url,
+            db=settings.redis_db,
+            protocol=3,
+            max_connections=settings.redis_max_connections,
+            health_check_interval=settings.redis_health_check_interval,
+            socket_keepalive=True,
+            socket_connect_timeout=settings.redis_connect_timeout
+        )
+    
+    return _redis_client
+
+
+def reset_redis_client() -> None:
+    """Reset the global Redis client instance (useful for testing)."""
+    global _redis_client
+    _redis_client = None
+
+
+class RedisCollectionBatch(CollectionBatch[T]):
+    """Batch that applies any number of queued writes in two round trips.
+    
+    The first pipeline performs the conditional item writes (SET NX for
+    creates, SET XX GET for updates, GETDEL for deletes). The second applies
+    the ID, time and field index bookkeeping for the writes that took effect.
+    """
+    
+    async def execute(self) -> None:
+        """Apply the queued operations with two pipelines."""
+        operations = self._drain()
+        if not operations:
+            return
+        
+        collection: RedisCollectionBase[T] = self._collection
+        try:
+            await self._apply(collection, operations)
+        except Exception as e:
+            for _, _, future in operations:
+                if not future.done():
+                    future.set_exception(e)
+            raise
+    
+    async def _apply(self, collection: 'RedisCollectionBase[T]', operations) -> None:
+        prepared = []
+        async with collection._redis.pipeline(transaction=False) as pipe:
+            for operation, args, future in operations:
+                if operation == 'create':
+                    item, item_id = args
+                    item_id = item_id or collection._generate_id()
+                    payload = collection._serialize_item(item)
+                    pipe.set(collection._get_item_key(item_id), payload, nx=True)
+                elif operation == 'update':
+                    item_id, item = args
+                    payload = collection._serialize_item(item)
+                    pipe.set(collection._get_item_key(item_id), payload, xx=True, get=True)
+                else:
+                    item_id, = args
+                    item = None
+                    pipe.getdel(collection._get_item_key(item_id))
+                prepared.append((operation, item_id, item, future))
+            results = await pipe.execute()
+        
+        score = _to_score(datetime.utcnow())
+        outcomes = []
+        async with collection._redis.pipeline(transaction=False) as pipe:
+            for (operation, item_id, item, future), result in zip(prepared, results):
+                if operation == 'create':
+                    if not result:
+                        outcomes.append((future, ValueError(f"Item with ID {item_id} already exists")))
+                        continue
+                    pipe.zadd(collection._index_key, {item_id: score})
+                    collection._queue_index_changes(pipe, item_id, None, item)
+                    pipe.zadd(collection._updated_key, {item_id: score})
+                    outcomes.append((future, item_id))
+                elif operation == 'update':
+                    if result is not None:
+                        collection._queue_index_changes(pipe, item_id, collection._load_indexed_item(result), item)
+                        pipe.zadd(collection._updated_key, {item_id: score})
+                    outcomes.append((future, result is not None))
+                else:
+                    if result is not None:
+                        pipe.delete(collection._get_timestamp_key(item_id))
+                        pipe.zrem(collection._index_key, item_id)
+                        pipe.zrem(collection._updated_key, item_id)
+                        collection._queue_index_changes(pipe, item_id, collection._load_indexed_item(result), None)
+                    outcomes.append((future, result is not None))
+            await pipe.execute()
+        
+        collection._invalidate(*(item_id for _, item_id, _, _ in prepared))
+        for future, outcome in outcomes:
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
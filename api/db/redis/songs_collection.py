@@ -1,8 +1,11 @@
-from typing import Optional, List, Dict, Any
+import asyncio
+from collections import Counter
+from functools import cached_property
+from typing import Optional, List, Dict, Any, FrozenSet
 from pydantic import BaseModel, Field
 from datetime import datetime
 
-from .base import RedisCollectionBase
+from .base import RedisCollectionBase, _tokenize
 from api.infrastructure.logging import get_logger
 
 
@@ -26,7 +29,13 @@ class Song(BaseModel):
     is_public: bool = Field(default=True, description="Whether the song is publicly visible")
     created_by: Optional[str] = Field(None, description="User ID who created the song")
     
+    @cached_property
+    def tags_lower(self) -> FrozenSet[str]:
+        """Lowercased tags, computed once per instance for case-insensitive matching."""
+        return frozenset(tag.lower() for tag in self.tags)
+    
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "title": "Master of Puppets",
@@ -52,6 +61,11 @@ class Song(BaseModel):
 class SongsCollection(RedisCollectionBase[Song]):
     """Songs collection with specialized methods for Guitar Pro tracks."""
     
+    INDEXED_FIELDS = frozenset({"genre", "is_public", "created_by"})
+    SEARCHABLE_FIELDS = frozenset({"title", "artist", "album", "genre", "tags", "instruments", "description"})
+    RANGE_INDEXED_FIELDS = frozenset({"difficulty"})
+    COUNTED_FIELDS = frozenset({"genre", "artist", "difficulty", "year"})
+    
     def __init__(self, redis_client=None):
         """Initialize the songs collection."""
         super().__init__(
@@ -62,56 +76,58 @@ class SongsCollection(RedisCollectionBase[Song]):
         self.logger = get_logger(__name__)
     
     async def search_by_artist(self, artist: str, limit: int = 100) -> List[Song]:
-        """Search songs by artist name."""
-        self.logger.debug(f"Searching songs by artist: {artist}")
+        """Search songs by artist name.
         
-        # Get all items and filter by artist
-        all_items = await self.list(limit=1000)  # Large limit for searching
+        Matches songs whose artist name contains the query (case-insensitive),
+        e.g. "metal" matches "Metallica"; candidates come from the search index.
+        """
+        self.logger.debug("Searching songs by artist: %s", artist)
         
-        matching_songs = [
-            song for song in all_items 
-            if artist.lower() in song.artist.lower()
-        ][:limit]
+        needle = artist.lower()
+        matching_songs = await self._find_by_substring(
+            artist,
+            lambda song: needle in song.artist.lower(),
+            limit
+        )
         
-        self.logger.debug(f"Found {len(matching_songs)} songs by artist: {artist}")
+        self.logger.debug("Found %s songs by artist: %s", len(matching_songs), artist)
         return matching_songs
     
     async def search_by_genre(self, genre: str, limit: int = 100) -> List[Song]:
         """Search songs by genre."""
-        self.logger.debug(f"Searching songs by genre: {genre}")
+        self.logger.debug("Searching songs by genre: %s", genre)
         
         filters = {"genre": genre}
         songs = await self.list(limit=limit, filters=filters)
         
-        self.logger.debug(f"Found {len(songs)} songs in genre: {genre}")
+        self.logger.debug("Found %s songs in genre: %s", len(songs), genre)
         return songs
     
     async def get_by_difficulty_range(self, min_difficulty: int, max_difficulty: int, limit: int = 100) -> List[Song]:
         """Get songs within a difficulty range."""
-        self.logger.debug(f"Getting songs with difficulty {min_difficulty}-{max_difficulty}")
-        
-        all_items = await self.list(limit=1000)
+        self.logger.debug("Getting songs with difficulty %s-%s", min_difficulty, max_difficulty)
         
-        matching_songs = [
-            song for song in all_items 
-            if song.difficulty is not None and min_difficulty <= song.difficulty <= max_difficulty
-        ][:limit]
+        matching_songs = await self.list_by_range("difficulty", min_difficulty, max_difficulty, limit=limit)
         
-        self.logger.debug(f"Found {len(matching_songs)} songs in difficulty range")
+        self.logger.debug("Found %s songs in difficulty range", len(matching_songs))
         return matching_songs
     
     async def get_by_instrument(self, instrument: str, limit: int = 100) -> List[Song]:
-        """Get songs that include a specific instrument."""
-        self.logger.debug(f"Getting songs with instrument: {instrument}")
+        """Get songs that include a specific instrument.
         
-        all_items = await self.list(limit=1000)
+        An instrument matches when its name contains the query (case-insensitive),
+        e.g. "guitar" matches "Electric Guitar".
+        """
+        self.logger.debug("Getting songs with instrument: %s", instrument)
         
-        matching_songs = [
-            song for song in all_items 
-            if any(instrument.lower() in instr.lower() for instr in song.instruments)
-        ][:limit]
+        needle = instrument.lower()
+        matching_songs = await self._find_by_substring(
+            instrument,
+            lambda song: any(needle in instr.lower() for instr in song.instruments),
+            limit
+        )
         
-        self.logger.debug(f"Found {len(matching_songs)} songs with instrument: {instrument}")
+        self.logger.debug("Found %s songs with instrument: %s", len(matching_songs), instrument)
         return matching_songs
     
     async def get_by_tags(self, tags: List[str], match_all: bool = False, limit: int = 100) -> List[Song]:
@@ -122,23 +138,24 @@ class SongsCollection(RedisCollectionBase[Song]):
             match_all: If True, song must have all tags. If False, any tag matches.
             limit: Maximum number of results
         """
-        self.logger.debug(f"Getting songs with tags: {tags}, match_all: {match_all}")
+        self.logger.debug("Getting songs with tags: %s, match_all: %s", tags, match_all)
+        
+        wanted = frozenset(tag.lower() for tag in tags)
         
-        all_items = await self.list(limit=1000)
+        def has_tags(song: Song) -> bool:
+            if match_all:
+                return wanted <= song.tags_lower
+            return not wanted.isdisjoint(song.tags_lower)
         
+        # Every word of a tag is in the search index of the songs carrying it,
+        # so the index yields candidates and the exact tag check runs on those
         if match_all:
-            matching_songs = [
-                song for song in all_items 
-                if all(tag.lower() in [t.lower() for t in song.tags] for tag in tags)
-            ]
+            token_sets = [set().union(*(_tokenize(tag) for tag in tags))]
         else:
-            matching_songs = [
-                song for song in all_items 
-                if any(tag.lower() in [t.lower() for t in song.tags] for tag in tags)
-            ]
+            token_sets = [_tokenize(tag) for tag in tags]
         
-        result = matching_songs[:limit]
-        self.logger.debug(f"Found {len(result)} songs with tags")
+        result = await self._find_by_tokens(token_sets, has_tags, limit)
+        self.logger.debug("Found %s songs with tags", len(result))
         return result
     
     async def get_public_songs(self, limit: int = 100) -> List[Song]:
@@ -148,70 +165,62 @@ class SongsCollection(RedisCollectionBase[Song]):
         filters = {"is_public": True}
         songs = await self.list(limit=limit, filters=filters)
         
-        self.logger.debug(f"Found {len(songs)} public songs")
+        self.logger.debug("Found %s public songs", len(songs))
         return songs
     
     async def get_songs_by_user(self, user_id: str, limit: int = 100) -> List[Song]:
         """Get songs created by a specific user."""
-        self.logger.debug(f"Getting songs by user: {user_id}")
+        self.logger.debug("Getting songs by user: %s", user_id)
         
         filters = {"created_by": user_id}
         songs = await self.list(limit=limit, filters=filters)
         
-        self.logger.debug(f"Found {len(songs)} songs by user: {user_id}")
+        self.logger.debug("Found %s songs by user: %s", len(songs), user_id)
         return songs
     
     async def get_recent_songs(self, days: int = 30, limit: int = 100) -> List[Song]:
         """Get recently created songs."""
-        self.logger.debug(f"Getting songs from last {days} days")
+        self.logger.debug("Getting songs from last %s days", days)
         
         from datetime import timedelta
         cutoff_date = datetime.utcnow() - timedelta(days=days)
         
         songs = await self.list_by_created_date(start_date=cutoff_date, limit=limit)
         
-        self.logger.debug(f"Found {len(songs)} recent songs")
+        self.logger.debug("Found %s recent songs", len(songs))
         return songs
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get collection statistics."""
+        """Get collection statistics, served from a short-lived Redis cache."""
         self.logger.debug("Getting songs collection statistics")
-        
-        total_songs = await self.count()
-        public_songs = await self.count(filters={"is_public": True})
-        
-        # Get all songs to calculate other stats
-        all_songs = await self.list(limit=10000)
-        
-        genres = {}
-        artists = {}
-        difficulties = {}
-        years = {}
-        
-        for song in all_songs:
-            # Genre stats
-            if song.genre:
-                genres[song.genre] = genres.get(song.genre, 0) + 1
-            
-            # Artist stats
-            artists[song.artist] = artists.get(song.artist, 0) + 1
-            
-            # Difficulty stats
-            if song.difficulty:
-                difficulties[song.difficulty] = difficulties.get(song.difficulty, 0) + 1
-            
-            # Year stats
-            if song.year:
-                years[song.year] = years.get(song.year, 0) + 1
+        stats = await self._get_cached_statistics(self._compute_statistics)
+        # Cached statistics are JSON, so the integer keys are restored here
+        for key in ("difficulty_distribution", "year_distribution"):
+            stats[key] = {int(value): count for value, count in stats[key].items()}
+        return stats
+    
+    async def _compute_statistics(self) -> Dict[str, Any]:
+        """Compute collection statistics."""
+        # Independent lookups; value distributions are kept up to date by every write
+        total_songs, public_songs, counts = await asyncio.gather(
+            self.count(),
+            self.count(filters={"is_public": True}),
+            self.get_value_counts("genre", "artist", "difficulty", "year")
+        )
+        genres = Counter({genre: count for genre, count in counts["genre"].items() if genre})
+        artists = Counter(counts["artist"])
+        difficulties = {int(difficulty): count for difficulty, count in counts["difficulty"].items()}
+        years = {int(year): count for year, count in counts["year"].items()}
         
         stats = {
             "total_songs": total_songs,
             "public_songs": public_songs,
             "private_songs": total_songs - public_songs,
-            "top_genres": dict(sorted(genres.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "top_artists": dict(sorted(artists.items(), key=lambda x: x[1], reverse=True)[:10]),
-            "difficulty_distribution": dict(sorted(difficulties.items())),
-            "year_distribution": dict(sorted(years.items(), reverse=True)[:10])
+            "top_genres": dict(genres.most_common(10)),
+            "top_artists": dict(artists.most_common(10)),
+            # Keys are rendered as strings for the JSON cache; get_statistics returns ints
+            "difficulty_distribution": {str(d): count for d, count in sorted(difficulties.items())},
+            "year_distribution": {str(year): count for year, count in sorted(years.items(), reverse=True)[:10]}
         }
         
         self.logger.debug("Generated songs collection statistics")
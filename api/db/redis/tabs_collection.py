@@ -1,7 +1,10 @@
-from typing import Optional, List, Dict, Any
+import asyncio
+from collections import Counter
+from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
 
-from .base import RedisCollectionBase
+from .base import RedisCollectionBase, _decode
 from api.abstractions.storage import FileReference
 from api.infrastructure.logging import get_logger
 
@@ -11,8 +14,9 @@ class Tab(BaseModel):
     
     id: str = Field(..., description="Tab unique identifier")
     file: FileReference = Field(..., description="Reference to the tab file")
-
+    
     class Config:
+        frozen = True
         json_schema_extra = {
             "example": {
                 "id": "123e4567-e89b-12d3-a456-426614174000",
@@ -27,6 +31,9 @@ class Tab(BaseModel):
 class TabsCollection(RedisCollectionBase[Tab]):
     """Tabs collection with specialized methods for Guitar Pro tabs."""
     
+    INDEXED_FIELDS = frozenset({"file.provider", "file.reference"})
+    COUNTED_FIELDS = frozenset({"file.provider"})
+    
     def __init__(self, redis_client=None):
         """Initialize the tabs collection."""
         super().__init__(
@@ -35,39 +42,91 @@ class TabsCollection(RedisCollectionBase[Tab]):
             redis_client=redis_client
         )
         self.logger = get_logger(__name__)
+        # String keys mapping a file reference to the ID of its tab
+        self._file_prefix = f"{self._field_index_prefix}file:"
+    
+    def _get_file_key(self, file: FileReference) -> str:
+        """Get the Redis key holding the ID of the tab for a file reference."""
+        return f"{self._file_prefix}{file.provider}:{file.reference}"
+    
+    def _queue_lookup_changes(self, pipe, item_id: str, old_item: Optional[Tab], new_item: Optional[Tab]) -> None:
+        """Queue updates of the file reference to tab ID keys."""
+        old_key = None if old_item is None else self._get_file_key(old_item.file)
+        new_key = None if new_item is None else self._get_file_key(new_item.file)
+        if old_key == new_key:
+            return
+        if old_key is not None:
+            pipe.delete(old_key)
+        if new_key is not None:
+            pipe.set(new_key, item_id)
+    
+    async def create_if_absent(self, file: FileReference, tab_id: Optional[str] = None) -> Tuple[str, Optional[datetime]]:
+        """Create a tab for a file reference unless the file already has one.
+        
+        The file reference is claimed with a single SET NX GET, so concurrent
+        creates for the same file cannot both succeed. A successful claim is
+        checked against the field indexes too, since tabs written before file
+        reference keys existed have no key to collide with.
+        
+        Args:
+            file: Reference to the tab file
+            tab_id: Optional ID for the tab. If None, generates one.
+            
+        Returns:
+            Tuple of the tab ID and its creation time; the creation time is None
+            and the ID is the existing tab's when the file already has a tab
+        """
+        tab_id = tab_id or self._generate_id()
+        file_key = self._get_file_key(file)
+        
+        existing_id = await self._redis.set(file_key, tab_id, nx=True, get=True)
+        if existing_id is not None:
+            self.logger.debug("File reference %s already belongs to tab: %s", file, _decode(existing_id))
+            return _decode(existing_id), None
+        
+        try:
+            existing_tab = await self.get_tab_by_file_reference(file.provider, file.reference)
+        except Exception:
+            await self._redis.delete(file_key)
+            raise
+        if existing_tab is not None:
+            # Point the claimed key at the existing tab so the next create finds it directly
+            await self._redis.set(file_key, existing_tab.id)
+            return existing_tab.id, None
+        
+        try:
+            # Built once the ID is known, so the stored tab carries its own ID
+            tab_id, created_at = await self.create_with_timestamps(Tab(id=tab_id, file=file), tab_id)
+        except Exception:
+            # Release the claim so the file reference can be created again
+            await self._redis.delete(file_key)
+            raise
+        return tab_id, created_at
     
     async def get_tab_by_file_reference(self, provider: str, reference: str) -> Optional[Tab]:
         """Get a tab by file reference."""
-        self.logger.debug(f"Searching tab by file reference: {provider}://{reference}")
+        self.logger.debug("Searching tab by file reference: %s://%s", provider, reference)
         
-        # Get all tabs and filter by file reference
-        all_tabs = await self.list(limit=1000)
-        
-        for tab in all_tabs:
-            if tab.file.provider == provider and tab.file.reference == reference:
-                self.logger.debug(f"Found tab with matching file reference: {tab.id}")
-                return tab
+        filters = {"file.provider": provider, "file.reference": reference}
+        for tab in await self.list(limit=1, filters=filters):
+            self.logger.debug("Found tab with matching file reference: %s", tab.id)
+            return tab
         
         self.logger.debug("No tab found with matching file reference")
         return None
     
     async def get_tabs_by_provider(self, provider: str, limit: int = 100) -> List[Tab]:
         """Get all tabs from a specific storage provider."""
-        self.logger.debug(f"Getting tabs from provider: {provider}")
+        self.logger.debug("Getting tabs from provider: %s", provider)
         
-        all_tabs = await self.list(limit=1000)
+        matching_tabs = await self.list(limit=limit, filters={"file.provider": provider})
         
-        matching_tabs = [
-            tab for tab in all_tabs 
-            if tab.file.provider == provider
-        ][:limit]
-        
-        self.logger.debug(f"Found {len(matching_tabs)} tabs from provider: {provider}")
+        self.logger.debug("Found %s tabs from provider: %s", len(matching_tabs), provider)
         return matching_tabs
     
     async def search_by_reference_pattern(self, pattern: str, limit: int = 100) -> List[Tab]:
         """Search tabs by reference pattern (case-insensitive)."""
-        self.logger.debug(f"Searching tabs by reference pattern: {pattern}")
+        self.logger.debug("Searching tabs by reference pattern: %s", pattern)
         
         all_tabs = await self.list(limit=1000)
         
@@ -76,25 +135,22 @@ class TabsCollection(RedisCollectionBase[Tab]):
             if pattern.lower() in tab.file.reference.lower()
         ][:limit]
         
-        self.logger.debug(f"Found {len(matching_tabs)} tabs matching pattern: {pattern}")
+        self.logger.debug("Found %s tabs matching pattern: %s", len(matching_tabs), pattern)
         return matching_tabs
     
     async def get_statistics(self) -> Dict[str, Any]:
-        """Get collection statistics."""
+        """Get collection statistics, served from a short-lived Redis cache."""
         self.logger.debug("Getting tabs collection statistics")
-        
-        total_tabs = await self.count()
-        all_tabs = await self.list(limit=10000)
-        
-        providers = {}
-        
-        for tab in all_tabs:
-            provider = tab.file.provider
-            providers[provider] = providers.get(provider, 0) + 1
+        return await self._get_cached_statistics(self._compute_statistics)
+    
+    async def _compute_statistics(self) -> Dict[str, Any]:
+        """Compute collection statistics."""
+        total_tabs, counts = await asyncio.gather(self.count(), self.get_value_counts("file.provider"))
+        providers = counts["file.provider"]
         
         stats = {
             "total_tabs": total_tabs,
-            "provider_distribution": dict(sorted(providers.items(), key=lambda x: x[1], reverse=True))
+            "provider_distribution": dict(Counter(providers).most_common())
         }
         
         self.logger.debug("Generated tabs collection statistics")
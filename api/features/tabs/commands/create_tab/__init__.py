@@ -2,7 +2,7 @@ from abc import ABC, abstractmethod
 from typing import Optional
 from pydantic import BaseModel
 
-from api.db.redis.tabs_collection import Tab, TabsCollection
+from api.db.redis.tabs_collection import TabsCollection
 from api.abstractions.storage import FileReference
 from api.infrastructure.logging import get_logger
 
@@ -42,33 +42,21 @@ class CreateTabHandlerImpl(CreateTabHandler):
     async def handle(self, command: CreateTabCommand) -> CreateTabResult:
         """Handle the create tab command."""
         try:
-            self.logger.debug(f"Creating tab with file reference: {command.file}")
+            self.logger.debug("Creating tab with file reference: %s", command.file)
 
-            # Check if tab with same file reference already exists
-            existing_tab = await self.tabs_collection.get_tab_by_file_reference(
-                command.file.provider,
-                command.file.reference
-            )
+            # Create in collection unless a tab with the same file reference exists
+            tab_id, created_at = await self.tabs_collection.create_if_absent(command.file, command.tab_id)
 
-            if existing_tab:
+            if created_at is None:
                 error_msg = f"Tab with file reference {command.file} already exists"
                 self.logger.warning(error_msg)
                 return CreateTabResult(
-                    tab_id=existing_tab.id,
+                    tab_id=tab_id,
                     success=False,
                     error=error_msg
                 )
 
-            # Create the tab
-            tab = Tab(
-                id=command.tab_id or "",  # Will be generated if empty
-                file=command.file
-            )
-
-            # Create in collection
-            tab_id, created_at = await self.tabs_collection.create_with_timestamps(tab, command.tab_id)
-
-            self.logger.info(f"Successfully created tab: {tab_id} at {created_at}")
+            self.logger.info("Successfully created tab: %s at %s", tab_id, created_at)
             return CreateTabResult(
                 tab_id=tab_id,
                 success=True
@@ -1,10 +1,19 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor
+from functools import lru_cache
+from itertools import chain, count, repeat
+from operator import attrgetter
 from typing import Optional, Dict, List
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from cachetools import LRUCache
+import asyncio
+import hashlib
 import io
 import guitarpro
+import redis.asyncio as redis
 
 from api.abstractions.storage import FileReference
+from api.db.redis.base import get_redis_client
 from api.services.storage import FileStorageService
 from api.infrastructure.logging import get_logger
 from ...models import (
@@ -24,6 +33,187 @@ from ...models import (
 
 logger = get_logger(__name__)
 
+# Version of the parse output; bump it whenever TabConverter or ParsedTabData
+# change so results cached by older code are no longer used
+PARSED_TAB_CACHE_VERSION = "1"
+
+# Parsed tabs are cached by the SHA-256 of the file content under this prefix
+PARSED_TAB_CACHE_PREFIX = f"parsed_tabs:v{PARSED_TAB_CACHE_VERSION}:"
+
+# Seconds a parsed tab is kept in Redis
+PARSED_TAB_CACHE_TTL = 86400
+
+# SerializableSongInfo text fields and the Song attributes they are read from
+_SONG_TEXT_FIELDS = {
+    'title': 'title',
+    'subtitle': 'subtitle',
+    'artist': 'artist',
+    'album': 'album',
+    'music': 'music',
+    'words': 'words',
+    'copyright': 'copyright',
+    'tab': 'tab',
+    'instructions': 'instructions',
+    'notice': 'notice',
+    'tempo_name': 'tempoName'
+}
+_get_song_texts = attrgetter(*_SONG_TEXT_FIELDS.values())
+
+# Attribute view used for notes and beats without effects
+_EMPTY_ATTRIBUTES: Dict[str, object] = {}
+
+# Legato kinds returned by _classify_hammer
+_HAMMER_ON = 'hammer_on'
+_PULL_OFF = 'pull_off'
+
+# Repetition and time signature fields read from every measure header
+_get_header_fields = attrgetter('isRepeatOpen', 'repeatClose', 'repeatAlternative', 'hasDoubleBar', 'timeSignature')
+
+# Time signature of measures before the first one that sets it
+_DEFAULT_TIME_SIGNATURE = SerializableTimeSignature(numerator=4, denominator=4)
+
+# Duration values mapped to their names
+_DURATION_MAP = {
+    1: "whole",
+    2: "half",
+    4: "quarter",
+    8: "eighth",
+    16: "sixteenth",
+    32: "thirty-second",
+    64: "sixty-fourth"
+}
+
+
+# Right hand finger names and characters mapped to their characters
+_RIGHT_HAND_FINGERS = {
+    'thumb': 'p',
+    'index': 'i',
+    'middle': 'm',
+    'ring': 'a',
+    'little': 'c',
+    'p': 'p',
+    'i': 'i',
+    'm': 'm',
+    'a': 'a',
+    'c': 'c'
+}
+
+
+@lru_cache(maxsize=256)
+def _color_to_hex(r, g, b) -> str:
+    """Format RGB components as a hex color string; songs reuse few colors."""
+    return f"#{r:02x}{g:02x}{b:02x}"
+
+
+@lru_cache(maxsize=32)
+def _right_hand_finger_char(finger) -> Optional[str]:
+    """Map a right hand finger enum/value to its character; songs use few fingers."""
+    if hasattr(finger, 'value'):
+        finger_val = finger.value
+    elif hasattr(finger, 'name'):
+        finger_val = finger.name
+    else:
+        finger_val = finger
+    return _RIGHT_HAND_FINGERS.get(str(finger_val).lower())
+
+
+@lru_cache(maxsize=64)
+def _make_time_signature(numerator, denominator) -> SerializableTimeSignature:
+    """Build a time signature; headers carry their own copies of a few distinct ones."""
+    return SerializableTimeSignature(numerator=numerator, denominator=denominator)
+
+
+@lru_cache(maxsize=64)
+def _make_tuning(values) -> tuple:
+    """Build the string tunings for MIDI values; tracks mostly share a few tunings."""
+    return tuple(
+        SerializableStringTuning(string_number=i + 1, value=value)
+        for i, value in enumerate(values)
+    )
+
+
+def _join_lines(value, default):
+    """Join list items line by line."""
+    return '\n'.join(map(str, value)) if value else default
+
+
+# String conversions for the exact types _safe_str sees most
+_SAFE_STR_CONVERTERS = {
+    str: lambda value, default: value,
+    list: _join_lines,
+    type(None): lambda value, default: default
+}
+
+
+def _safe_str(value, default=''):
+    """Convert a value to a string, joining lists line by line."""
+    convert = _SAFE_STR_CONVERTERS.get(type(value))
+    if convert is not None:
+        return convert(value, default)
+    # Subclasses are rare, handle them like their base types
+    if isinstance(value, str):
+        return value
+    elif isinstance(value, list):
+        return _join_lines(value, default)
+    return str(value)
+
+
+def _safe_int(value, default, min_val, max_val):
+    """Convert a value to an integer clamped to a range."""
+    if type(value) is int:
+        return max(min_val, min(max_val, value))
+    if value is None:
+        return default
+    try:
+        int_val = int(value)
+        return max(min_val, min(max_val, int_val))
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_time_sig_int(value, default=4):
+    """Convert a time signature component, which may be a Duration, to an integer."""
+    if value is None:
+        return default
+    if isinstance(value, int):
+        return value
+    # Handle Duration objects or other complex types
+    if hasattr(value, 'value'):
+        return getattr(value, 'value', default)
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_key_int(value, default=0):
+    """Convert a key signature value to an integer."""
+    if value is None:
+        return default
+    if isinstance(value, int):
+        return value
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+def _safe_note_int(value, default, min_val=None, max_val=None):
+    """Convert a note value to an integer, optionally clamped."""
+    if type(value) is int and min_val is not None and max_val is not None:
+        return min(max_val, max(min_val, value))
+    if value is None:
+        return default
+    try:
+        int_val = int(value)
+        if min_val is not None:
+            int_val = max(min_val, int_val)
+        if max_val is not None:
+            int_val = min(max_val, int_val)
+        return int_val
+    except (ValueError, TypeError):
+        return default
+
 
 class ParseTabCommand(BaseModel):
     """Command to parse a Guitar Pro tab file."""
@@ -47,19 +237,65 @@ class ParseTabHandler(ABC):
         """Handle the parse tab command."""
         pass
 
+    async def handle_batch(self, commands: List[ParseTabCommand]) -> List[ParseTabResult]:
+        """Handle several parse tab commands concurrently.
+
+        Args:
+            commands: Parse tab commands to handle
+
+        Returns:
+            List of results aligned with commands
+        """
+        return list(await asyncio.gather(*(self.handle(command) for command in commands)))
+
 
 class ParseTabHandlerImpl(ParseTabHandler):
     """Implementation of parse tab handler."""
 
-    def __init__(self, storage_service: FileStorageService):
-        """Initialize the handler with dependencies."""
+    def __init__(self,
+                 storage_service: FileStorageService,
+                 redis_client: Optional[redis.Redis] = None,
+                 cache_size: int = 64,
+                 executor: Optional[Executor] = None):
+        """Initialize the handler with dependencies.
+
+        Args:
+            storage_service: Storage service the tab files are read from
+            redis_client: Optional Redis client for the shared parse cache. If None, uses the global client.
+            cache_size: Maximum number of parsed tabs kept in the local cache
+            executor: Optional executor, typically a ProcessPoolExecutor, tab files are
+                parsed in. If None, files are parsed in a worker thread.
+        """
         self.storage_service = storage_service
         self.logger = get_logger(__name__)
+        self._redis = redis_client or get_redis_client()
+        self._executor = executor
+        self._converter = TabConverter()
+
+        # Parse results are cached by content hash, which cannot go stale:
+        # locally and in Redis, which shares them between processes.
+        # Cached results are shared between callers and must not be mutated.
+        self._parsed_cache: LRUCache = LRUCache(maxsize=cache_size)
+        # Content hash of each (file reference, version) seen, so repeated
+        # parses of an unchanged file skip the download too
+        self._digest_cache: LRUCache = LRUCache(maxsize=cache_size * 4)
 
     async def handle(self, command: ParseTabCommand) -> ParseTabResult:
         """Handle the parse tab command."""
         try:
-            self.logger.debug(f"Parsing tab file: {command.file_reference}")
+            self.logger.debug("Parsing tab file: %s", command.file_reference)
+
+            # Files at a reference may be overwritten, so the reference is only
+            # trusted together with a version that changes with the content
+            version = await self.storage_service.get_file_version(command.file_reference)
+            parsed_data = (await self._get_cached_reference_parse(command.file_reference, version)
+                           if version is not None else None)
+            if parsed_data is not None:
+                self.logger.debug("Parse cache hit for tab file: %s", command.file_reference)
+                return ParseTabResult(
+                    success=True,
+                    parsed_data=parsed_data
+                )
 
             # Get file data from storage
             file_data = await self.storage_service.get_file(command.file_reference)
@@ -71,13 +307,14 @@ class ParseTabHandlerImpl(ParseTabHandler):
                     error=error_msg
                 )
 
-            # Parse with PyGuitarPro
-            song = guitarpro.parse(io.BytesIO(file_data))
-
-            # Convert to serializable format
-            parsed_data = self._convert_song_to_serializable(song)
+            digest = hashlib.sha256(file_data).hexdigest()
+            parsed_data = await self._get_cached_parse(digest)
+            if parsed_data is None:
+                parsed_data = await self._parse(digest, file_data)
+            if version is not None:
+                await self._cache_reference_digest(command.file_reference, version, digest)
 
-            self.logger.info(f"Successfully parsed tab file: {command.file_reference}")
+            self.logger.info("Successfully parsed tab file: %s", command.file_reference)
             return ParseTabResult(
                 success=True,
                 parsed_data=parsed_data
@@ -91,45 +328,139 @@ class ParseTabHandlerImpl(ParseTabHandler):
                 error=error_msg
             )
 
+    async def _get_cached_reference_parse(self, file_reference: FileReference,
+                                          version: str) -> Optional[ParsedTabData]:
+        """Get the cached parse result for a file version without downloading the file."""
+        digest = self._digest_cache.get((file_reference, version))
+        if digest is None:
+            try:
+                digest = await self._redis.get(self._get_reference_key(file_reference, version))
+            except redis.RedisError as e:
+                self.logger.warning("Cannot read parse cache: %s", e)
+                return None
+            if digest is None:
+                return None
+            if isinstance(digest, bytes):
+                digest = digest.decode("utf-8")
+            self._digest_cache[(file_reference, version)] = digest
+
+        parsed_data = await self._get_cached_parse(digest)
+        if parsed_data is None:
+            # The parse result expired or was dropped, so the file is read again
+            self._digest_cache.pop((file_reference, version), None)
+        return parsed_data
+
+    async def _cache_reference_digest(self, file_reference: FileReference, version: str, digest: str) -> None:
+        """Remember the content hash of a file version locally and in Redis."""
+        if self._digest_cache.get((file_reference, version)) == digest:
+            return
+        self._digest_cache[(file_reference, version)] = digest
+        try:
+            await self._redis.set(self._get_reference_key(file_reference, version), digest, ex=PARSED_TAB_CACHE_TTL)
+        except redis.RedisError as e:
+            self.logger.warning("Cannot write parse cache: %s", e)
+
+    @staticmethod
+    def _get_reference_key(file_reference: FileReference, version: str) -> str:
+        """Get the Redis key holding the content hash of a file version."""
+        return f"{PARSED_TAB_CACHE_PREFIX}ref:{file_reference.provider}:{file_reference.reference}:{version}"
+
+    async def _get_cached_parse(self, digest: str) -> Optional[ParsedTabData]:
+        """Get the parse result for a file content hash from the local cache or Redis."""
+        parsed_data = self._parsed_cache.get(digest)
+        if parsed_data is not None:
+            return parsed_data
+
+        try:
+            payload = await self._redis.get(f"{PARSED_TAB_CACHE_PREFIX}{digest}")
+        except redis.RedisError as e:
+            self.logger.warning("Cannot read parse cache: %s", e)
+            return None
+        if payload is None:
+            return None
+
+        try:
+            parsed_data = await asyncio.to_thread(ParsedTabData.model_validate_json, payload)
+        except ValidationError as e:
+            # Parse the file again rather than failing on it until the entry expires
+            self.logger.warning("Dropping invalid parse cache entry %s: %s", digest, e)
+            self._parsed_cache.pop(digest, None)
+            try:
+                await self._redis.delete(f"{PARSED_TAB_CACHE_PREFIX}{digest}")
+            except redis.RedisError as e:
+                self.logger.warning("Cannot write parse cache: %s", e)
+            return None
+        self._parsed_cache[digest] = parsed_data
+        return parsed_data
+
+    async def _parse(self, digest: str, file_data: bytes) -> ParsedTabData:
+        """Parse file data off the event loop and cache the result under its content hash."""
+        if self._executor is None:
+            # Parsing is CPU-bound, keep it off the event loop
+            parsed_data = await asyncio.to_thread(self._converter.parse, file_data)
+            payload = await asyncio.to_thread(parsed_data.model_dump_json)
+        else:
+            # Results cross the process boundary as JSON, which is also what Redis stores
+            loop = asyncio.get_running_loop()
+            payload = await loop.run_in_executor(self._executor, _parse_tab_file_to_json, file_data)
+            try:
+                parsed_data = await asyncio.to_thread(ParsedTabData.model_validate_json, payload)
+            except ValidationError as e:
+                # Never cache a result that cannot be read back; convert here instead
+                self.logger.warning("Discarding invalid worker parse result %s: %s", digest, e)
+                parsed_data = await asyncio.to_thread(self._converter.parse, file_data)
+                payload = await asyncio.to_thread(parsed_data.model_dump_json)
+
+        await self._cache_parse(digest, parsed_data, payload)
+        return parsed_data
+
+    async def _cache_parse(self, digest: str, parsed_data: ParsedTabData, payload: str) -> None:
+        """Cache the parse result for a file content hash locally and, as JSON, in Redis."""
+        self._parsed_cache[digest] = parsed_data
+        try:
+            await self._redis.set(f"{PARSED_TAB_CACHE_PREFIX}{digest}", payload, ex=PARSED_TAB_CACHE_TTL)
+        except redis.RedisError as e:
+            self.logger.warning("Cannot write parse cache: %s", e)
+
+
+class TabConverter:
+    """Converts PyGuitarPro songs to the serializable tab models.
+    
+    Holds no state, so one instance can be shared between threads and
+    executor worker processes can build their own.
+    """
+    
+    def parse(self, file_data: bytes) -> ParsedTabData:
+        """Parse Guitar Pro file data with PyGuitarPro and convert it to serializable format."""
+        song = guitarpro.parse(io.BytesIO(file_data))
+        return self._convert_song_to_serializable(song)
+
     def _convert_song_to_serializable(self, song: guitarpro.Song) -> ParsedTabData:
         """Convert PyGuitarPro Song to serializable format."""
 
-        # Helper function to safely convert to string
-        def safe_str(value, default=''):
-            if isinstance(value, str):
-                return value
-            elif isinstance(value, list):
-                return '\n'.join(str(item) for item in value) if value else default
-            elif value is None:
-                return default
-            else:
-                return str(value)
-
-        # Extract song info with safe string conversion
+        # Extract song info with safe string conversion, reading all text
+        # attributes at once; guitarpro songs always define them
+        try:
+            texts = _get_song_texts(song)
+        except AttributeError:
+            texts = tuple(getattr(song, attribute, '') for attribute in _SONG_TEXT_FIELDS.values())
         song_info = SerializableSongInfo(
-            title=safe_str(getattr(song, 'title', '')),
-            subtitle=safe_str(getattr(song, 'subtitle', '')),
-            artist=safe_str(getattr(song, 'artist', '')),
-            album=safe_str(getattr(song, 'album', '')),
-            music=safe_str(getattr(song, 'music', '')),
-            words=safe_str(getattr(song, 'words', '')),
-            copyright=safe_str(getattr(song, 'copyright', '')),
-            tab=safe_str(getattr(song, 'tab', '')),
-            instructions=safe_str(getattr(song, 'instructions', '')),
-            notice=safe_str(getattr(song, 'notice', '')),
+            **{field: _safe_str(text) for field, text in zip(_SONG_TEXT_FIELDS, texts)},
             tempo=getattr(song, 'tempo', 120),
-            tempo_name=safe_str(getattr(song, 'tempoName', '')),
             hide_tempo=getattr(song, 'hideTempo', False)
         )
 
         # Extract tracks
-        tracks = []
-        for i, track in enumerate(song.tracks):
-            serializable_track = self._convert_track_to_serializable(track, i)
-            tracks.append(serializable_track)
+        # Beat-level tempo changes (measure number -> BPM), collected while converting
+        tempo_changes: Dict[int, int] = {}
+        measure_headers = getattr(song, 'measureHeaders', [])
+        tracks = [
+            self._convert_track_to_serializable(track, i, tempo_changes, measure_headers)
+            for i, track in enumerate(song.tracks)
+        ]
 
         # Get measure count
-        measure_count = len(getattr(song, 'measureHeaders', []))
+        measure_count = len(measure_headers)
 
         # Check for lyrics
         has_lyrics = bool(getattr(song, 'lyrics', None) and
@@ -140,7 +471,7 @@ class ParseTabHandlerImpl(ParseTabHandler):
         version_str = f"{version[0]}.{version[1]}" if version else "Unknown"
 
         # Extract song-level measures with section names from first track
-        measures = self._extract_song_measures(song, tracks)
+        measures = self._extract_song_measures(song, tracks, tempo_changes)
 
         return ParsedTabData(
             song_info=song_info,
@@ -151,22 +482,18 @@ class ParseTabHandlerImpl(ParseTabHandler):
             version=version_str
         )
 
-    def _convert_track_to_serializable(self, track: guitarpro.Track, index: int) -> SerializableTrack:
-        """Convert PyGuitarPro Track to serializable format."""
+    def _convert_track_to_serializable(self, track: guitarpro.Track, index: int,
+                                       tempo_changes: Dict[int, int],
+                                       measure_headers: Optional[List] = None) -> SerializableTrack:
+        """Convert PyGuitarPro Track to serializable format, recording beat-level tempo changes.
+
+        measure_headers are the song's measure headers; they are read from
+        track.song when not given.
+        """
 
         # Get track name
         name = getattr(track, 'name', f'Track {index + 1}')
 
-        # Helper function to safely get integer values within range
-        def safe_int(value, default, min_val, max_val):
-            if value is None:
-                return default
-            try:
-                int_val = int(value)
-                return max(min_val, min(max_val, int_val))
-            except (ValueError, TypeError):
-                return default
-
         # Get track settings
         channel = getattr(track, 'channel', None)
         settings = SerializableTrackSettings(
@@ -179,9 +506,9 @@ class ParseTabHandlerImpl(ParseTabHandler):
             is_muted=getattr(track, 'isMute', False),
             is_solo=getattr(track, 'isSolo', False),
             is_visible=getattr(track, 'isVisible', True),
-            volume=safe_int(getattr(channel, 'volume', None) if channel else None, 64, 0, 127),
-            pan=safe_int(getattr(channel, 'balance', None) if channel else None, 64, 0, 127),
-            channel=safe_int(getattr(channel, 'channel1', None) if channel else None, 1, 1, 16)
+            volume=_safe_int(getattr(channel, 'volume', None) if channel else None, 64, 0, 127),
+            pan=_safe_int(getattr(channel, 'balance', None) if channel else None, 64, 0, 127),
+            channel=_safe_int(getattr(channel, 'channel1', None) if channel else None, 1, 1, 16)
         )
 
         # Get instrument info
@@ -192,25 +519,25 @@ class ParseTabHandlerImpl(ParseTabHandler):
         string_count = len(strings) if strings else 6
 
         # Convert string tuning
-        tuning = []
-        for i, string in enumerate(strings):
-            tuning.append(SerializableStringTuning(
-                string_number=i + 1,
-                value=getattr(string, 'value', 40 + i * 5)  # Default tuning
-            ))
+        tuning = list(_make_tuning(tuple(
+            getattr(string, 'value', 40 + i * 5)  # Default tuning
+            for i, string in enumerate(strings)
+        )))
 
         # Parse measures for this track
         track_measures = getattr(track, 'measures', [])
         measure_count = len(track_measures)
-        song_measure_headers = getattr(track.song, 'measureHeaders', [])
+        if measure_headers is None:
+            measure_headers = getattr(track.song, 'measureHeaders', [])
+        header_count = len(measure_headers)
         
         # Convert measures to serializable format
-        serializable_measures = []
-        for i, measure in enumerate(track_measures):
-            serializable_measure = self._convert_measure_to_serializable(
-                measure, i + 1, song_measure_headers[i] if i < len(song_measure_headers) else None
+        serializable_measures = [
+            self._convert_measure_to_serializable(
+                measure, i + 1, measure_headers[i] if i < header_count else None, tempo_changes
             )
-            serializable_measures.append(serializable_measure)
+            for i, measure in enumerate(track_measures)
+        ]
 
         # Additional metadata
         metadata = {
@@ -244,79 +571,41 @@ class ParseTabHandlerImpl(ParseTabHandler):
 
         # Convert Color object to hex if it has RGB values
         if hasattr(color, 'r') and hasattr(color, 'g') and hasattr(color, 'b'):
-            r = getattr(color, 'r', 0)
-            g = getattr(color, 'g', 0)
-            b = getattr(color, 'b', 0)
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return _color_to_hex(getattr(color, 'r', 0), getattr(color, 'g', 0), getattr(color, 'b', 0))
 
         return None
     
-    def _convert_measure_to_serializable(self, measure, measure_number: int, header=None) -> SerializableMeasure:
+    def _convert_measure_to_serializable(self, measure, measure_number: int, header=None,
+                                         tempo_changes: Optional[Dict[int, int]] = None) -> SerializableMeasure:
         """Convert PyGuitarPro Measure to serializable format."""
         
         # Parse beats/voices in this measure
-        beats = []
-        voices = getattr(measure, 'voices', [])
-        
-        for voice in voices:
-            voice_beats = getattr(voice, 'beats', [])
-            for beat in voice_beats:
-                serializable_beat = self._convert_beat_to_serializable(beat, voice)
-                beats.append(serializable_beat)
-        
-        # Helper function to safely extract integer from time signature components
-        def safe_time_sig_int(value, default=4):
-            if value is None:
-                return default
-            if isinstance(value, int):
-                return value
-            # Handle Duration objects or other complex types
-            if hasattr(value, 'value'):
-                return getattr(value, 'value', default)
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return default
-
+        beats = self._convert_measure_beats(measure, {} if tempo_changes is None else tempo_changes)
+        
         # Get time signature (from header or measure)
         time_sig = None
-        if header and hasattr(header, 'timeSignature'):
-            ts = header.timeSignature
-            time_sig = SerializableTimeSignature(
-                numerator=safe_time_sig_int(getattr(ts, 'numerator', 4)),
-                denominator=safe_time_sig_int(getattr(ts, 'denominator', 4))
-            )
-        elif hasattr(measure, 'timeSignature') and measure.timeSignature:
-            ts = measure.timeSignature
+        ts = getattr(header, 'timeSignature', None) if header else None
+        if ts is None:
+            ts = getattr(measure, 'timeSignature', None)
+        if ts:
             time_sig = SerializableTimeSignature(
-                numerator=safe_time_sig_int(getattr(ts, 'numerator', 4)),
-                denominator=safe_time_sig_int(getattr(ts, 'denominator', 4))
+                numerator=_safe_time_sig_int(getattr(ts, 'numerator', 4)),
+                denominator=_safe_time_sig_int(getattr(ts, 'denominator', 4))
             )
         
-        # Helper function to safely extract integer from key signature
-        def safe_key_int(value, default=0):
-            if value is None:
-                return default
-            if isinstance(value, int):
-                return value
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return default
-
         # Get key signature
         key_sig = None
-        if hasattr(measure, 'keySignature') and measure.keySignature:
-            ks = measure.keySignature
+        ks = getattr(measure, 'keySignature', None)
+        if ks:
             key_sig = SerializableKeySignature(
-                key=safe_key_int(getattr(ks, 'key', 0)),
+                key=_safe_key_int(getattr(ks, 'key', 0)),
                 is_minor=bool(getattr(ks, 'isMinor', False))
             )
         
         # Get marker
         marker = None
-        if hasattr(measure, 'marker') and measure.marker:
-            m = measure.marker
+        m = getattr(measure, 'marker', None)
+        if m:
             marker = SerializableMarker(
                 title=getattr(m, 'title', ''),
                 color=self._convert_marker_color(m)
@@ -336,8 +625,7 @@ class ParseTabHandlerImpl(ParseTabHandler):
         repeat_alternative = getattr(header, 'repeatAlternative', 0) if header else 0
         
         # Handle repeat close value (-1 means no repeat in guitarpro)
-        if repeat_close == -1:
-            repeat_close = 0
+        repeat_close = max(repeat_close, 0)
         
         return SerializableMeasure(
             number=measure_number,
@@ -352,107 +640,119 @@ class ParseTabHandlerImpl(ParseTabHandler):
             double_bar=double_bar
         )
     
-    def _convert_beat_to_serializable(self, beat, voice=None) -> SerializableBeat:
-        """Convert PyGuitarPro Beat to serializable format."""
-        
-        # Parse notes in this beat
-        notes = getattr(beat, 'notes', [])
-        serializable_notes = []
-        
-        for note in notes:
-            if hasattr(note, 'string') and hasattr(note, 'value'):
-                serializable_note = self._convert_note_to_serializable(note)
-                serializable_notes.append(serializable_note)
-        
-        # Get tuplet information using improved extraction
-        tuplet = self._get_tuplet_info(beat, voice)
-        
-        # Create voice for these notes
-        serializable_voice = SerializableVoice(
-            notes=serializable_notes,
-            duration=self._get_duration_string(beat),
-            tuplet=tuplet,
-            is_rest=len(serializable_notes) == 0
-        )
+    def _convert_measure_beats(self, measure, tempo_changes: Dict[int, int]) -> List[SerializableBeat]:
+        """Convert the beats of every voice in a PyGuitarPro Measure to serializable format.
+        
+        Beats are converted inline in a single loop per measure rather than
+        through a method call per beat. The first mix table tempo change of
+        the measure is recorded in tempo_changes unless one is known already,
+        so the song measures need no separate pass over all beats.
+        """
+        convert_note = self._convert_note_to_serializable
+        duration_string = self._get_duration_string
+        beats = []
+        header_number = getattr(getattr(measure, 'header', None), 'number', 0)
+        
+        for voice in getattr(measure, 'voices', []):
+            for beat in getattr(voice, 'beats', []):
+                # Parse notes in this beat
+                serializable_notes = [
+                    convert_note(note)
+                    for note in getattr(beat, 'notes', [])
+                    if hasattr(note, 'string') and hasattr(note, 'value')
+                ]
+                duration = duration_string(beat)
+                
+                # Create voice for these notes, with tuplet information from the beat or voice
+                serializable_voice = SerializableVoice(
+                    notes=serializable_notes,
+                    duration=duration,
+                    tuplet=self._get_tuplet_info(beat, voice),
+                    is_rest=len(serializable_notes) == 0
+                )
+                
+                # Get beat effects, read from the instance dictionary like note effects
+                effect = getattr(beat, 'effect', None)
+                effect_attributes = effect.__dict__ if effect else _EMPTY_ATTRIBUTES
+                
+                if header_number > 0 and header_number not in tempo_changes:
+                    mtc = effect_attributes.get('mixTableChange')
+                    if mtc and getattr(mtc, 'tempo', None):
+                        tempo_value = getattr(mtc.tempo, 'value', None)
+                        if tempo_value and tempo_value > 0:
+                            tempo_changes[header_number] = tempo_value
+                
+                # Get stroke direction if available  
+                stroke_direction = None
+                stroke = effect_attributes.get('stroke')
+                if stroke:
+                    direction = getattr(stroke, 'direction', None)
+                    if direction:
+                        # Convert stroke direction enum to string
+                        stroke_direction = str(direction).lower()
+                
+                beats.append(SerializableBeat(
+                    voices=[serializable_voice],
+                    start_time=getattr(beat, 'start', 0),
+                    duration=duration,
+                    # Text could be from text, chord, or other annotations
+                    text=self._get_beat_text(beat, effect),
+                    fade_in=effect_attributes.get('fadeIn', False),
+                    fade_out=effect_attributes.get('fadeOut', False),
+                    volume_swell=effect_attributes.get('volumeSwell', False),
+                    tremolo_picking=effect_attributes.get('tremoloPicking', False),
+                    stroke_direction=stroke_direction
+                ))
         
-        # Get beat effects
-        effect = getattr(beat, 'effect', None)
-        
-        # Get stroke direction if available  
-        stroke_direction = None
-        stroke = getattr(effect, 'stroke', None) if effect else None
-        if stroke:
-            direction = getattr(stroke, 'direction', None)
-            if direction:
-                # Convert stroke direction enum to string
-                stroke_direction = str(direction).lower() if hasattr(direction, 'name') else str(direction).lower()
-        
-        # Extract beat text (could be from text, chord, or other annotations)
-        beat_text = self._get_beat_text(beat, effect)
-        
-        return SerializableBeat(
-            voices=[serializable_voice],
-            start_time=getattr(beat, 'start', 0),
-            duration=self._get_duration_string(beat),
-            text=beat_text,
-            fade_in=getattr(effect, 'fadeIn', False) if effect else False,
-            fade_out=getattr(effect, 'fadeOut', False) if effect else False,
-            volume_swell=getattr(effect, 'volumeSwell', False) if effect else False,
-            tremolo_picking=getattr(effect, 'tremoloPicking', False) if effect else False,
-            stroke_direction=stroke_direction
-        )
+        return beats
     
     def _convert_note_to_serializable(self, note) -> SerializableNote:
         """Convert PyGuitarPro Note to serializable format."""
         
-        # Helper function to safely extract integer values
-        def safe_note_int(value, default, min_val=None, max_val=None):
-            if value is None:
-                return default
-            try:
-                int_val = int(value)
-                if min_val is not None:
-                    int_val = max(min_val, int_val)
-                if max_val is not None:
-                    int_val = min(max_val, int_val)
-                return int_val
-            except (ValueError, TypeError):
-                return default
-        
-        # Get note effects
-        effect = getattr(note, 'effect', None)
+        # Read plain attributes straight from the instance dictionaries, this
+        # runs once per note. realValue is a property and is read normally.
+        note_attributes = note.__dict__
+        effect = note_attributes.get('effect')
+        effect_attributes = effect.__dict__ if effect else _EMPTY_ATTRIBUTES
+        note_type = note_attributes.get('type')
+        # Most notes carry no bend, slide, legato or grace effect; the helpers
+        # are only called for effects that are actually set
+        hammer = effect_attributes.get('hammer')
+        legato = self._classify_hammer(hammer) if hammer else None
         
         return SerializableNote(
-            string=safe_note_int(getattr(note, 'string', 1), 1, 1, 8),
-            fret=safe_note_int(getattr(note, 'value', 0), 0, 0, 24),
-            value=safe_note_int(getattr(note, 'realValue', 40), 40, 0, 127),  # MIDI value
-            velocity=safe_note_int(getattr(note, 'velocity', 95), 95, 0, 127),
-            tied=bool(getattr(note, 'isTiedNote', False)),
-            muted=getattr(note, 'type', None) == 'muted' if hasattr(note, 'type') else False,
-            ghost=getattr(note, 'type', None) == 'ghost' if hasattr(note, 'type') else False,
-            accent=bool(getattr(effect, 'accentuatedNote', False)) if effect else False,
-            heavy_accent=bool(getattr(effect, 'heavyAccentuatedNote', False)) if effect else False,
-            harmonic=getattr(effect, 'harmonic', None) is not None if effect else False,
-            palm_mute=bool(getattr(effect, 'palmMute', False)) if effect else False,
-            staccato=bool(getattr(effect, 'staccato', False)) if effect else False,
-            let_ring=bool(getattr(effect, 'letRing', False)) if effect else False,
-            bend_value=self._get_bend_value(effect) if effect else None,
-            slide_type=self._get_slide_type(effect) if effect else None,
-            vibrato=bool(getattr(effect, 'vibrato', False)) if effect else False,
+            string=_safe_note_int(note_attributes.get('string', 1), 1, 1, 8),
+            fret=_safe_note_int(note_attributes.get('value', 0), 0, 0, 24),
+            value=_safe_note_int(getattr(note, 'realValue', 40), 40, 0, 127),  # MIDI value
+            velocity=_safe_note_int(note_attributes.get('velocity', 95), 95, 0, 127),
+            tied=bool(note_attributes.get('isTiedNote', False)),
+            muted=note_type == 'muted',
+            ghost=note_type == 'ghost',
+            accent=bool(effect_attributes.get('accentuatedNote', False)),
+            heavy_accent=bool(effect_attributes.get('heavyAccentuatedNote', False)),
+            harmonic=effect_attributes.get('harmonic') is not None,
+            palm_mute=bool(effect_attributes.get('palmMute', False)),
+            staccato=bool(effect_attributes.get('staccato', False)),
+            let_ring=bool(effect_attributes.get('letRing', False)),
+            bend_value=self._get_bend_value(effect) if effect_attributes.get('bend') else None,
+            slide_type=self._get_slide_type(effect) if effect_attributes.get('slides') else None,
+            vibrato=bool(effect_attributes.get('vibrato', False)),
             
             # Legato techniques
-            hammer_on=self._is_hammer_on(effect) if effect else False,
-            pull_off=self._is_pull_off(effect) if effect else False,
+            hammer_on=legato == _HAMMER_ON,
+            pull_off=legato == _PULL_OFF,
             
             # Advanced techniques  
-            trill=bool(getattr(effect, 'trill', False)) if effect else False,
-            tremolo_picking=bool(getattr(effect, 'tremoloPicking', False)) if effect else False,
-            grace_note=bool(getattr(effect, 'grace', False)) if effect else False,
-            grace_note_type=self._get_grace_note_type(effect) if effect else None,
+            trill=bool(effect_attributes.get('trill', False)),
+            tremolo_picking=bool(effect_attributes.get('tremoloPicking', False)),
+            grace_note=bool(effect_attributes.get('grace', False)),
+            grace_note_type=self._get_grace_note_type(effect) if effect_attributes.get('grace') else None,
             
             # Fingering
-            left_hand_finger=self._get_left_hand_finger(effect) if effect else None,
-            right_hand_finger=self._get_right_hand_finger(effect) if effect else None
+            left_hand_finger=(self._get_left_hand_finger(effect)
+                              if effect_attributes.get('leftHandFinger') is not None else None),
+            right_hand_finger=(self._get_right_hand_finger(effect)
+                               if effect_attributes.get('rightHandFinger') is not None else None)
         )
     
     def _get_duration_string(self, beat) -> str:
@@ -461,35 +761,22 @@ class ParseTabHandlerImpl(ParseTabHandler):
         if not duration:
             return "quarter"
         
-        # Map duration values to string names
-        duration_map = {
-            1: "whole",
-            2: "half", 
-            4: "quarter",
-            8: "eighth",
-            16: "sixteenth",
-            32: "thirty-second",
-            64: "sixty-fourth"
-        }
-        
         value = getattr(duration, 'value', 4)
-        return duration_map.get(value, "quarter")
+        return _DURATION_MAP.get(value, "quarter")
     
     def _get_bend_value(self, effect) -> Optional[float]:
         """Extract bend value from note effect."""
-        if hasattr(effect, 'bend') and effect.bend:
-            bend = effect.bend
-            if hasattr(bend, 'value'):
-                return getattr(bend, 'value', 0) / 100.0  # Convert to semitones
+        bend = getattr(effect, 'bend', None)
+        if bend:
+            value = getattr(bend, 'value', None)
+            if value is not None:
+                return value / 100.0  # Convert to semitones
         return None
     
     def _get_slide_type(self, effect) -> Optional[str]:
         """Extract slide type from note effect."""
-        if hasattr(effect, 'slides') and effect.slides:
-            slides = effect.slides
-            if slides:
-                return str(slides[0]) if slides else None
-        return None
+        slides = getattr(effect, 'slides', None)
+        return str(slides[0]) if slides else None
     
     def _convert_marker_color(self, marker) -> Optional[str]:
         """Convert marker color to hex string."""
@@ -498,43 +785,29 @@ class ParseTabHandlerImpl(ParseTabHandler):
             return None
         
         if hasattr(color, 'r') and hasattr(color, 'g') and hasattr(color, 'b'):
-            r = getattr(color, 'r', 0)
-            g = getattr(color, 'g', 0) 
-            b = getattr(color, 'b', 0)
-            return f"#{r:02x}{g:02x}{b:02x}"
+            return _color_to_hex(getattr(color, 'r', 0), getattr(color, 'g', 0), getattr(color, 'b', 0))
         
         return None
     
-    def _is_hammer_on(self, effect) -> bool:
-        """Check if note is a hammer-on."""
-        hammer = getattr(effect, 'hammer', None)
+    def _classify_hammer(self, hammer) -> Optional[str]:
+        """Classify a hammer effect as a hammer-on, a pull-off or neither."""
         if not hammer:
-            return False
+            return None
         
-        # In guitarpro, hammer-on is typically when origin note is lower than destination
+        # In guitarpro, hammer-on is typically when origin note is lower than
+        # destination, and pull-off when it is higher
         origin = getattr(hammer, 'originValue', None)
         destination = getattr(hammer, 'destinationValue', None)
         
         if origin is not None and destination is not None:
-            return destination > origin
+            if destination > origin:
+                return _HAMMER_ON
+            if destination < origin:
+                return _PULL_OFF
+            return None
         
         # Fallback: just check if hammer effect exists
-        return True
-    
-    def _is_pull_off(self, effect) -> bool:
-        """Check if note is a pull-off."""
-        hammer = getattr(effect, 'hammer', None)
-        if not hammer:
-            return False
-        
-        # In guitarpro, pull-off is typically when origin note is higher than destination  
-        origin = getattr(hammer, 'originValue', None)
-        destination = getattr(hammer, 'destinationValue', None)
-        
-        if origin is not None and destination is not None:
-            return destination < origin
-        
-        return False
+        return _HAMMER_ON
     
     def _get_grace_note_type(self, effect) -> Optional[str]:
         """Get grace note type."""
@@ -569,31 +842,11 @@ class ParseTabHandlerImpl(ParseTabHandler):
         finger = getattr(effect, 'rightHandFinger', None)
         if finger is None:
             return None
-        
-        # Convert finger enum/value to character
-        if hasattr(finger, 'value'):
-            finger_val = getattr(finger, 'value', '')
-        elif hasattr(finger, 'name'):
-            finger_val = getattr(finger, 'name', '')
-        else:
-            finger_val = str(finger)
-        
-        # Map common finger values
-        finger_map = {
-            'thumb': 'p',
-            'index': 'i', 
-            'middle': 'm',
-            'ring': 'a',
-            'little': 'c'
-        }
-        
-        finger_str = str(finger_val).lower()
-        if finger_str in finger_map:
-            return finger_map[finger_str]
-        elif finger_str in ['p', 'i', 'm', 'a', 'c']:
-            return finger_str
-        
-        return None
+        try:
+            return _right_hand_finger_char(finger)
+        except TypeError:
+            # Unhashable finger value, map it without the cache
+            return _right_hand_finger_char.__wrapped__(finger)
     
     def _get_tuplet_info(self, beat, voice=None) -> Optional[Dict[str, int]]:
         """Extract tuplet information from beat or voice."""
@@ -613,7 +866,7 @@ class ParseTabHandlerImpl(ParseTabHandler):
         # Also check if beat has duration that implies tuplet
         if not tuplet:
             duration = getattr(beat, 'duration', None)
-            if duration and hasattr(duration, 'tuplet'):
+            if duration:
                 tuplet = getattr(duration, 'tuplet', None)
         
         if tuplet:
@@ -634,234 +887,103 @@ class ParseTabHandlerImpl(ParseTabHandler):
         text_parts = []
         
         # Check for direct text attribute
-        if hasattr(beat, 'text') and beat.text:
-            text_parts.append(str(beat.text))
+        text = getattr(beat, 'text', None)
+        if text:
+            text_parts.append(str(text))
         
         # Check for chord information in effect
-        if effect and hasattr(effect, 'chord'):
-            chord = getattr(effect, 'chord', None)
-            if chord:
-                chord_name = getattr(chord, 'name', None) or getattr(chord, 'root', None)
-                if chord_name:
-                    text_parts.append(str(chord_name))
+        chord = getattr(effect, 'chord', None) if effect else None
+        if chord:
+            chord_name = getattr(chord, 'name', None) or getattr(chord, 'root', None)
+            if chord_name:
+                text_parts.append(str(chord_name))
         
         # Check for chord directly on beat
-        if hasattr(beat, 'chord'):
-            chord = getattr(beat, 'chord', None)
-            if chord:
-                chord_name = getattr(chord, 'name', None) or getattr(chord, 'root', None)
-                if chord_name:
-                    text_parts.append(str(chord_name))
+        chord = getattr(beat, 'chord', None)
+        if chord:
+            chord_name = getattr(chord, 'name', None) or getattr(chord, 'root', None)
+            if chord_name:
+                text_parts.append(str(chord_name))
         
         # Check for any annotation or text properties
         for attr_name in ['annotation', 'textMarker', 'displayText']:
-            if hasattr(beat, attr_name):
-                attr_value = getattr(beat, attr_name, None)
-                if attr_value:
-                    text_parts.append(str(attr_value))
+            attr_value = getattr(beat, attr_name, None)
+            if attr_value:
+                text_parts.append(str(attr_value))
         
         return ' '.join(text_parts) if text_parts else ''
     
     def _extract_time_signature_safely(self, time_sig) -> 'SerializableTimeSignature':
         """Extract time signature, handling Duration objects for denominator."""
-        from ...models import SerializableTimeSignature
-        
         numerator = getattr(time_sig, 'numerator', 4)
         denominator_value = getattr(time_sig, 'denominator', 4)
         
         # Handle Duration object for denominator
         if hasattr(denominator_value, 'value'):
             denominator_value = denominator_value.value
-            
-        return SerializableTimeSignature(
-            numerator=numerator,
-            denominator=denominator_value
-        )
+        
+        try:
+            return _make_time_signature(numerator, denominator_value)
+        except TypeError:
+            # Unhashable values, build the time signature without the cache
+            return _make_time_signature.__wrapped__(numerator, denominator_value)
     
-    def _extract_song_measures(self, song, tracks) -> List:
-        """Extract song-level measures with section names from first track beat text."""
-        from ...models import SerializableMeasureInfo, SerializableTimeSignature
+    def _extract_song_measures(self, song, tracks, tempo_changes: Dict[int, int]) -> List:
+        """Extract song-level measures with section names from first track beat text.
         
-        measures = []
+        tempo_changes maps measure numbers to the beat-level tempo changes
+        found while converting the tracks.
+        """
+        from ...models import SerializableMeasureInfo
         
-        # Get measure count
-        measure_count = len(getattr(song, 'measureHeaders', []))
+        measures = []
+        song_measure_headers = getattr(song, 'measureHeaders', [])
         
         # Initialize current tempo and time signature from song defaults
         current_tempo = getattr(song, 'tempo', 120)
         current_time_sig = None  # Will be set from first measure header or default to 4/4
         
-        # Pre-scan for tempo changes from beat-level mix table changes
-        tempo_changes = {}  # measure_number -> tempo_bpm
-        for track in getattr(song, 'tracks', []):
-            for measure in getattr(track, 'measures', []):
-                measure_number = getattr(getattr(measure, 'header', None), 'number', 0)
-                if measure_number > 0:
-                    for voice in getattr(measure, 'voices', []):
-                        for beat in getattr(voice, 'beats', []):
-                            effect = getattr(beat, 'effect', None)
-                            if effect:
-                                mtc = getattr(effect, 'mixTableChange', None)
-                                if mtc and hasattr(mtc, 'tempo') and mtc.tempo:
-                                    tempo_value = getattr(mtc.tempo, 'value', None)
-                                    if tempo_value and tempo_value > 0:
-                                        # Store the first tempo change found in this measure
-                                        if measure_number not in tempo_changes:
-                                            tempo_changes[measure_number] = tempo_value
-        
-        # If no tracks, just create basic measures without section names but with repetition info
-        if not tracks:
-            song_measure_headers = getattr(song, 'measureHeaders', [])
-            for i in range(measure_count):  # First case: no tracks
-                # Still get repetition info from headers even without tracks
-                repeat_open = False
-                repeat_close = 0
-                repeat_alternative = 0
-                double_bar = False
-                
-                if i < len(song_measure_headers):
-                    header = song_measure_headers[i]
-                    repeat_open = getattr(header, 'isRepeatOpen', False)
-                    repeat_close = getattr(header, 'repeatClose', 0)
-                    repeat_alternative = getattr(header, 'repeatAlternative', 0)
-                    double_bar = getattr(header, 'hasDoubleBar', False)
-                    
-                    # Update tempo if there's a tempo change (header or beat-level)
-                    if hasattr(header, 'tempo') and header.tempo > 0:
-                        current_tempo = header.tempo
-                    elif (i + 1) in tempo_changes:
-                        current_tempo = tempo_changes[i + 1]
-                    
-                    # Update time signature if available
-                    if hasattr(header, 'timeSignature') and header.timeSignature:
-                        current_time_sig = self._extract_time_signature_safely(header.timeSignature)
-                    elif current_time_sig is None:
-                        # Default to 4/4 if no time signature found yet
-                        current_time_sig = SerializableTimeSignature(numerator=4, denominator=4)
-                    
-                    if repeat_close == -1:
-                        repeat_close = 0
-                
-                measures.append(SerializableMeasureInfo(
-                    number=i + 1,
-                    section_name="",
-                    tempo_bpm=current_tempo,
-                    time_signature=current_time_sig if current_time_sig else SerializableTimeSignature(numerator=4, denominator=4),
-                    repeat_open=repeat_open,
-                    repeat_close=repeat_close,
-                    repeat_alternative=repeat_alternative,
-                    double_bar=double_bar
-                ))
-            return measures  # No tracks case
-        
-        # Use first track to extract section names from beat text
-        first_track = song.tracks[0] if song.tracks else None
-        if not first_track:
-            # Fallback: create measures without section names but with repetition info
-            song_measure_headers = getattr(song, 'measureHeaders', [])
-            for i in range(measure_count):  # Second case: no first track
-                repeat_open = False
-                repeat_close = 0
-                repeat_alternative = 0
-                double_bar = False
-                
-                if i < len(song_measure_headers):
-                    header = song_measure_headers[i]
-                    repeat_open = getattr(header, 'isRepeatOpen', False)
-                    repeat_close = getattr(header, 'repeatClose', 0)
-                    repeat_alternative = getattr(header, 'repeatAlternative', 0)
-                    double_bar = getattr(header, 'hasDoubleBar', False)
-                    
-                    # Update tempo if there's a tempo change (header or beat-level)
-                    if hasattr(header, 'tempo') and header.tempo > 0:
-                        current_tempo = header.tempo
-                    elif (i + 1) in tempo_changes:
-                        current_tempo = tempo_changes[i + 1]
-                    
-                    # Update time signature if available
-                    if hasattr(header, 'timeSignature') and header.timeSignature:
-                        current_time_sig = self._extract_time_signature_safely(header.timeSignature)
-                    elif current_time_sig is None:
-                        # Default to 4/4 if no time signature found yet
-                        current_time_sig = SerializableTimeSignature(numerator=4, denominator=4)
-                    
-                    if repeat_close == -1:
-                        repeat_close = 0
-                
-                measures.append(SerializableMeasureInfo(
-                    number=i + 1,
-                    section_name="",
-                    tempo_bpm=current_tempo,
-                    time_signature=current_time_sig if current_time_sig else SerializableTimeSignature(numerator=4, denominator=4),
-                    repeat_open=repeat_open,
-                    repeat_close=repeat_close,
-                    repeat_alternative=repeat_alternative,
-                    double_bar=double_bar
-                ))
-            return measures  # No first track case
+        # Section names come from the first track's beat text; without tracks
+        # measures only get repetition info
+        first_track = song.tracks[0] if tracks and song.tracks else None
+        track_measures = getattr(first_track, 'measures', []) if first_track else []
+        # Pad the track measures so measures past the end of the track get no section name
+        track_measures_or_none = chain(track_measures, repeat(None))
+        get_tempo_change = tempo_changes.get
+        append_measure = measures.append
         
-        # Extract section names and repetition info from first track measures and song headers
-        track_measures = getattr(first_track, 'measures', [])
-        song_measure_headers = getattr(song, 'measureHeaders', [])
-        
-        for measure_idx in range(measure_count):
-            measure_number = measure_idx + 1
-            section_name = ""
-            
+        for measure_number, header, measure in zip(count(1), song_measure_headers, track_measures_or_none):
             # Get repetition information from measure header
-            repeat_open = False
-            repeat_close = 0
-            repeat_alternative = 0
-            double_bar = False
-            
-            if measure_idx < len(song_measure_headers):
-                header = song_measure_headers[measure_idx]
+            try:
+                repeat_open, repeat_close, repeat_alternative, double_bar, time_signature = _get_header_fields(header)
+            except AttributeError:
                 repeat_open = getattr(header, 'isRepeatOpen', False)
                 repeat_close = getattr(header, 'repeatClose', 0)
                 repeat_alternative = getattr(header, 'repeatAlternative', 0)
                 double_bar = getattr(header, 'hasDoubleBar', False)
-                
-                # Update tempo if there's a tempo change (header or beat-level)
-                if hasattr(header, 'tempo') and header.tempo > 0:
-                    current_tempo = header.tempo
-                elif measure_number in tempo_changes:
-                    current_tempo = tempo_changes[measure_number]
-                
-                # Update time signature if available
-                if hasattr(header, 'timeSignature') and header.timeSignature:
-                    current_time_sig = self._extract_time_signature_safely(header.timeSignature)
-                elif current_time_sig is None:
-                    # Default to 4/4 if no time signature found yet
-                    current_time_sig = SerializableTimeSignature(numerator=4, denominator=4)
-                
-                # Handle repeat close value (-1 means no repeat in guitarpro)
-                if repeat_close == -1:
-                    repeat_close = 0
+                time_signature = getattr(header, 'timeSignature', None)
+            
+            # Update tempo if there's a tempo change (header or beat-level);
+            # guitarpro headers carry no tempo, other header types may
+            tempo = getattr(header, 'tempo', None)
+            if tempo and tempo > 0:
+                current_tempo = tempo
+            else:
+                current_tempo = get_tempo_change(measure_number, current_tempo)
+            
+            # Update time signature if available
+            if time_signature:
+                current_time_sig = self._extract_time_signature_safely(time_signature)
             elif current_time_sig is None:
-                # Ensure we have a default time signature even if no headers
-                current_time_sig = SerializableTimeSignature(numerator=4, denominator=4)
+                # Default to 4/4 if no time signature found yet
+                current_time_sig = _DEFAULT_TIME_SIGNATURE
             
-            # Get the corresponding measure from first track for section name
-            if measure_idx < len(track_measures):
-                measure = track_measures[measure_idx]
-                voices = getattr(measure, 'voices', [])
-                
-                # Look for text in the first voice's first beat
-                for voice in voices:
-                    voice_beats = getattr(voice, 'beats', [])
-                    if voice_beats:
-                        first_beat = voice_beats[0]
-                        # Extract text from this beat
-                        beat_text = self._get_beat_text(first_beat, getattr(first_beat, 'effect', None))
-                        if beat_text.strip():
-                            section_name = beat_text.strip()
-                            break
-                    if section_name:
-                        break
+            # Handle repeat close value (-1 means no repeat in guitarpro)
+            repeat_close = max(repeat_close, 0)
             
-            measures.append(SerializableMeasureInfo(
+            append_measure(SerializableMeasureInfo(
                 number=measure_number,
-                section_name=section_name,
+                section_name=self._get_section_name(measure) if measure is not None else "",
                 tempo_bpm=current_tempo,
                 time_signature=current_time_sig,
                 repeat_open=repeat_open,
@@ -870,4 +992,19 @@ class ParseTabHandlerImpl(ParseTabHandler):
                 double_bar=double_bar
             ))
         
-        return measures
\ No newline at end of file
+        return measures
+    
+    def _get_section_name(self, measure) -> str:
+        """Get the section name from the text of the first beat of a measure's voices."""
+        first_beats = (
+            voice_beats[0]
+            for voice_beats in (getattr(voice, 'beats', None) for voice in getattr(measure, 'voices', []))
+            if voice_beats
+        )
+        beat_texts = (self._get_beat_text(beat, getattr(beat, 'effect', None)).strip() for beat in first_beats)
+        return next((beat_text for beat_text in beat_texts if beat_text), "")
+
+
+def _parse_tab_file_to_json(file_data: bytes) -> str:
+    """Parse Guitar Pro file data into ParsedTabData JSON; runs in executor worker processes."""
+    return TabConverter().parse(file_data).model_dump_json()
@@ -47,6 +47,8 @@ class SerializableStringTuning(BaseModel):
     value: int = Field(..., description="MIDI note value")
     
     class Config:
+        # Shared between tracks, so instances must not change
+        frozen = True
         json_schema_extra = {
             "example": {
                 "string_number": 1,
@@ -196,6 +198,8 @@ class SerializableTimeSignature(BaseModel):
     denominator: int = Field(4, description="Time signature denominator")
     
     class Config:
+        # Shared between measures, so instances must not change
+        frozen = True
         json_schema_extra = {
             "example": {
                 "numerator": 4,
@@ -40,7 +40,7 @@ class GetTabHandlerImpl(GetTabHandler):
     async def handle(self, query: GetTabQuery) -> GetTabResult:
         """Handle the get tab query."""
         try:
-            self.logger.debug(f"Getting tab with ID: {query.tab_id}")
+            self.logger.debug("Getting tab with ID: %s", query.tab_id)
 
             # Get the tab from collection
             tab = await self.tabs_collection.read(query.tab_id)
@@ -54,7 +54,7 @@ class GetTabHandlerImpl(GetTabHandler):
                     error=error_msg
                 )
 
-            self.logger.debug(f"Successfully retrieved tab: {query.tab_id}")
+            self.logger.debug("Successfully retrieved tab: %s", query.tab_id)
             return GetTabResult(
                 tab=tab,
                 success=True
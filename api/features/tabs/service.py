@@ -55,15 +55,15 @@ class TabsService:
         Returns:
             CreateTabResult with creation status and tab ID
         """
-        self.logger.debug(f"Creating tab with file: {file}")
+        self.logger.debug("Creating tab with file: %s", file)
         
         command = CreateTabCommand(file=file, tab_id=tab_id)
         result = await self._create_tab_handler.handle(command)
         
         if result.success:
-            self.logger.info(f"Tab created successfully: {result.tab_id}")
+            self.logger.info("Tab created successfully: %s", result.tab_id)
         else:
-            self.logger.warning(f"Tab creation failed: {result.error}")
+            self.logger.warning("Tab creation failed: %s", result.error)
         
         return result
     
@@ -76,15 +76,15 @@ class TabsService:
         Returns:
             GetTabResult with tab data or error
         """
-        self.logger.debug(f"Getting tab: {tab_id}")
+        self.logger.debug("Getting tab: %s", tab_id)
         
         query = GetTabQuery(tab_id=tab_id)
         result = await self._get_tab_handler.handle(query)
         
         if result.success:
-            self.logger.debug(f"Tab retrieved successfully: {tab_id}")
+            self.logger.debug("Tab retrieved successfully: %s", tab_id)
         else:
-            self.logger.warning(f"Tab retrieval failed: {result.error}")
+            self.logger.warning("Tab retrieval failed: %s", result.error)
         
         return result
     
@@ -97,15 +97,15 @@ class TabsService:
         Returns:
             ParseTabResult with parsed data or error
         """
-        self.logger.debug(f"Parsing tab file: {file_reference}")
+        self.logger.debug("Parsing tab file: %s", file_reference)
         
         command = ParseTabCommand(file_reference=file_reference)
         result = await self._parse_tab_handler.handle(command)
         
         if result.success:
-            self.logger.debug(f"Tab parsed successfully: {file_reference}")
+            self.logger.debug("Tab parsed successfully: %s", file_reference)
         else:
-            self.logger.warning(f"Tab parsing failed: {result.error}")
+            self.logger.warning("Tab parsing failed: %s", result.error)
         
         return result
     
@@ -120,7 +120,7 @@ class TabsService:
         Returns:
             VideoExportResult with video file reference or error
         """
-        self.logger.debug(f"Exporting video for song: {parsed_data.song_info.title}")
+        self.logger.debug("Exporting video for song: %s", parsed_data.song_info.title)
         
         command = VideoExportCommand(song_id=song_id, parsed_data=parsed_data, **kwargs)
         result = await self._video_export_handler.handle(command)
@@ -4,13 +4,17 @@ from contextlib import asynccontextmanager
 from typing import List
 from openai.types.chat.chat_completion_message_param import ChatCompletionMessageParam
 from pydantic import BaseModel
-from fastapi import FastAPI, Query
-from fastapi.responses import StreamingResponse, RedirectResponse
+from fastapi import FastAPI, Query, Request as HTTPRequest
+from fastapi.responses import ORJSONResponse, StreamingResponse, RedirectResponse
 from openai import OpenAI
 from api.utils.prompt import ClientMessage, convert_to_openai_messages
 from api.utils.tools import get_current_weather
+from api.utils import serialization
 from api.settings.app_settings import settings
 from api.routes import songs_router
+from api.abstractions.identity_map import request_scope
+from api.db.redis.songs_collection import get_songs_collection
+from api.db.redis.tabs_collection import get_tabs_collection
 from api.infrastructure.logging import get_logger
 
 
@@ -39,6 +43,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Failed to dump OpenAPI schema: {e}")
     
+    # Index data written by earlier versions before serving requests
+    for collection in (get_songs_collection(), get_tabs_collection()):
+        try:
+            await collection.ensure_indexes()
+        except Exception as e:
+            logger.error(f"Failed to ensure indexes of collection {collection.collection_name}: {e}")
+    
     yield
     
     # Shutdown (if needed)
@@ -51,9 +62,19 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/swagger",
     redoc_url="/redoc",
+    # Parsed tabs are large nested documents; orjson encodes them much faster
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
+
+@app.middleware("http")
+async def identity_map_scope(request: HTTPRequest, call_next):
+    """Share items read from collections across the handling of one request."""
+    async with request_scope():
+        return await call_next(request)
+
+
 # Include routers
 app.include_router(songs_router)
 
@@ -146,13 +167,13 @@ def stream_text(messages: List[ChatCompletionMessageParam], protocol: str = 'dat
 
                 for tool_call in draft_tool_calls:
                     tool_result = available_tools[tool_call["name"]](
-                        **json.loads(tool_call["arguments"]))
+                        **serialization.loads(tool_call["arguments"]))
 
                     yield 'a:{{"toolCallId":"{id}","toolName":"{name}","args":{args},"result":{result}}}\n'.format(
                         id=tool_call["id"],
                         name=tool_call["name"],
                         args=tool_call["arguments"],
-                        result=json.dumps(tool_result))
+                        result=serialization.dumps(tool_result))
 
             elif choice.delta.tool_calls:
                 for tool_call in choice.delta.tool_calls:
@@ -169,7 +190,7 @@ def stream_text(messages: List[ChatCompletionMessageParam], protocol: str = 'dat
                         draft_tool_calls[draft_tool_calls_index]["arguments"] += arguments
 
             else:
-                yield '0:{text}\n'.format(text=json.dumps(choice.delta.content))
+                yield '0:{text}\n'.format(text=serialization.dumps(choice.delta.content))
 
         if not chunk.choices:
             usage = chunk.usage
@@ -213,4 +234,12 @@ async def handle_chat_data(
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host=settings.host, port=settings.port, log_level=settings.log_level.lower())
+
+    # Prefer uvloop's libuv-based loop; fall back to asyncio where it is unavailable (e.g. Windows)
+    try:
+        import uvloop  # noqa: F401
+        loop = "uvloop"
+    except ImportError:
+        loop = "asyncio"
+
+    uvicorn.run(app, host=settings.host, port=settings.port, log_level=settings.log_level.lower(), loop=loop)
@@ -0,0 +1,3 @@
+from .counters import MetricCounter, get_counter, get_metrics_snapshot, reset_metrics
+
+__all__ = ['MetricCounter', 'get_counter', 'get_metrics_snapshot', 'reset_metrics']
@@ -0,0 +1,45 @@
+from typing import Dict, Optional
+
+
+class MetricCounter:
+    """Monotonic counter that is cheap enough to bump on every hot-path call.
+    
+    Counters are bumped from the event loop thread, so a plain integer needs
+    no lock (unlike logging, which locks each handler).
+    """
+    
+    __slots__ = ('name', 'value')
+    
+    def __init__(self, name: str):
+        self.name = name
+        self.value = 0
+    
+    def increment(self) -> None:
+        """Add one to the counter."""
+        self.value += 1
+    
+    def reset(self) -> None:
+        """Set the counter back to zero."""
+        self.value = 0
+
+
+_counters: Dict[str, MetricCounter] = {}
+
+
+def get_counter(name: str) -> MetricCounter:
+    """Get the process-wide counter with the given name, creating it on first use."""
+    counter: Optional[MetricCounter] = _counters.get(name)
+    if counter is None:
+        counter = _counters.setdefault(name, MetricCounter(name))
+    return counter
+
+
+def get_metrics_snapshot() -> Dict[str, int]:
+    """Get the current value of every registered counter."""
+    return {name: counter.value for name, counter in list(_counters.items())}
+
+
+def reset_metrics() -> None:
+    """Set every registered counter back to zero (useful for testing)."""
+    for counter in list(_counters.values()):
+        counter.reset()
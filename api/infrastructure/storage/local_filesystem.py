@@ -1,7 +1,8 @@
+import asyncio
 import os
 import shutil
 from pathlib import Path
-from typing import BinaryIO, Optional, List
+from typing import AsyncIterator, BinaryIO, Dict, Optional, List
 import aiofiles
 import aiofiles.os
 
@@ -49,6 +50,29 @@ class LocalFilesystemFileProvider(FileProviderBase):
         except Exception:
             return None
     
+    async def save_files(self, files: Dict[str, BinaryIO]) -> Dict[str, bool]:
+        """Save several files to the local filesystem concurrently."""
+        results = await asyncio.gather(*(self.save_file(path, data) for path, data in files.items()))
+        return dict(zip(files, results))
+    
+    async def get_files(self, file_paths: List[str]) -> Dict[str, Optional[bytes]]:
+        """Retrieve several files from the local filesystem concurrently."""
+        results = await asyncio.gather(*(self.get_file(path) for path in file_paths))
+        return dict(zip(file_paths, results))
+    
+    async def get_file_stream(self, file_path: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Stream a file from the local filesystem in chunks."""
+        full_path = self._get_full_path(file_path)
+        if not full_path.exists():
+            return
+        
+        async with aiofiles.open(full_path, 'rb') as f:
+            while True:
+                chunk = await f.read(chunk_size)
+                if not chunk:
+                    break
+                yield chunk
+    
     async def delete_file(self, file_path: str) -> bool:
         """Delete a file from the local filesystem."""
         try:
@@ -95,6 +119,14 @@ class LocalFilesystemFileProvider(FileProviderBase):
         except Exception:
             return None
     
+    async def get_file_version(self, file_path: str) -> Optional[str]:
+        """Get the modification time and size of a file as its version."""
+        try:
+            stat_result = await aiofiles.os.stat(self._get_full_path(file_path))
+            return f"{stat_result.st_mtime_ns}-{stat_result.st_size}"
+        except Exception:
+            return None
+    
     async def copy_file(self, source_path: str, destination_path: str) -> bool:
         """Copy a file from source to destination."""
         try:
@@ -1,6 +1,8 @@
+import asyncio
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError, NoCredentialsError, BotoCoreError
-from typing import BinaryIO, Optional, List
+from typing import AsyncIterator, BinaryIO, Dict, Optional, List
 
 from api.abstractions.storage import FileProviderBase
 from api.settings.app_settings import settings
@@ -10,6 +12,9 @@ from api.infrastructure.logging import get_logger
 class AwsS3FileProvider(FileProviderBase):
     """AWS S3 implementation of FileProviderBase."""
     
+    # Upper bound on concurrent transfers in save_files/get_files; also sizes the HTTP pool
+    MAX_CONCURRENT_TRANSFERS = 16
+    
     def __init__(self, bucket_name: Optional[str] = None, prefix: Optional[str] = None, region_name: Optional[str] = None):
         self.logger = get_logger(__name__)
         """Initialize the AWS S3 provider.
@@ -51,7 +56,7 @@ class AwsS3FileProvider(FileProviderBase):
         session = boto3.Session(**session_kwargs)
         
         # Create S3 client with explicit configuration
-        s3_client_kwargs = {}
+        s3_client_kwargs = {'config': Config(max_pool_connections=self.MAX_CONCURRENT_TRANSFERS)}
         if region:
             s3_client_kwargs['region_name'] = region
             
@@ -115,6 +120,10 @@ class AwsS3FileProvider(FileProviderBase):
     
     async def save_file(self, file_path: str, file_data: BinaryIO) -> bool:
         """Save a file to S3."""
+        return self._save_file_sync(file_path, file_data)
+    
+    def _save_file_sync(self, file_path: str, file_data: BinaryIO) -> bool:
+        """Blocking upload shared by save_file and the threaded save_files."""
         s3_key = self._get_s3_key(file_path)
         self.logger.debug(f"Saving file to S3: {s3_key}")
         
@@ -147,6 +156,10 @@ class AwsS3FileProvider(FileProviderBase):
     
     async def get_file(self, file_path: str) -> Optional[bytes]:
         """Retrieve a file from S3."""
+        return self._get_file_sync(file_path)
+    
+    def _get_file_sync(self, file_path: str) -> Optional[bytes]:
+        """Blocking download shared by get_file and the threaded get_files."""
         s3_key = self._get_s3_key(file_path)
         self.logger.debug(f"Getting file from S3: {s3_key}")
         
@@ -171,6 +184,65 @@ class AwsS3FileProvider(FileProviderBase):
             self.logger.exception(f"Unexpected error getting file {s3_key}: {e}")
             return None
     
+    async def save_files(self, files: Dict[str, BinaryIO]) -> Dict[str, bool]:
+        """Upload several files to S3 concurrently."""
+        self.logger.debug(f"Saving {len(files)} files to S3")
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TRANSFERS)
+        
+        async def save(file_path: str, file_data: BinaryIO) -> bool:
+            async with semaphore:
+                return await asyncio.to_thread(self._save_file_sync, file_path, file_data)
+        
+        results = await asyncio.gather(*(save(path, data) for path, data in files.items()))
+        return dict(zip(files, results))
+    
+    async def get_files(self, file_paths: List[str]) -> Dict[str, Optional[bytes]]:
+        """Download several files from S3 concurrently."""
+        self.logger.debug(f"Getting {len(file_paths)} files from S3")
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TRANSFERS)
+        
+        async def get(file_path: str) -> Optional[bytes]:
+            async with semaphore:
+                return await asyncio.to_thread(self._get_file_sync, file_path)
+        
+        results = await asyncio.gather(*(get(path) for path in file_paths))
+        return dict(zip(file_paths, results))
+    
+    async def get_file_stream(self, file_path: str, chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Stream a file from S3 in chunks without buffering the whole object.
+        
+        boto3 is blocking, so the request and every chunk read run in a worker thread.
+        """
+        s3_key = self._get_s3_key(file_path)
+        self.logger.debug(f"Streaming file from S3: {s3_key}")
+        
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.get_object,
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+        except ClientError as e:
+            if e.response['Error']['Code'] == 'NoSuchKey':
+                self.logger.debug(f"File not found in S3: {s3_key}")
+                return
+            self.logger.exception(f"AWS error streaming file {s3_key}: {e}")
+            return
+        except BotoCoreError as e:
+            self.logger.exception(f"AWS configuration error streaming {s3_key}: {e}")
+            return
+        
+        body = response['Body']
+        try:
+            chunks = body.iter_chunks(chunk_size)
+            while True:
+                chunk = await asyncio.to_thread(next, chunks, None)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            body.close()
+    
     async def delete_file(self, file_path: str) -> bool:
         """Delete a file from S3."""
         s3_key = self._get_s3_key(file_path)
@@ -251,6 +323,25 @@ class AwsS3FileProvider(FileProviderBase):
             self.logger.exception(f"Unexpected error listing files with prefix {prefix}: {e}")
             return []
     
+    async def get_file_version(self, file_path: str) -> Optional[str]:
+        """Get the ETag of a file as its version."""
+        s3_key = self._get_s3_key(file_path)
+        
+        try:
+            response = await asyncio.to_thread(
+                self.s3_client.head_object,
+                Bucket=self.bucket_name,
+                Key=s3_key
+            )
+            return response['ETag'].strip('"')
+        except ClientError as e:
+            if e.response['Error']['Code'] != '404':
+                self.logger.exception(f"AWS error getting file version {s3_key}: {e}")
+            return None
+        except BotoCoreError as e:
+            self.logger.exception(f"AWS configuration error getting file version {s3_key}: {e}")
+            return None
+    
     async def get_file_size(self, file_path: str) -> Optional[int]:
         """Get the size of a file in bytes."""
         s3_key = self._get_s3_key(file_path)
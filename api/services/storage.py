@@ -1,4 +1,4 @@
-from typing import Optional, List, BinaryIO, Dict, Union
+from typing import AsyncIterator, Optional, List, BinaryIO, Dict, Union
 from enum import Enum
 
 from api.abstractions.storage import FileProviderBase, FileReference
@@ -250,6 +250,28 @@ class FileStorageService:
             self.logger.exception(f"Error getting file {file_ref}: {e}")
             return None
     
+    async def get_file_stream(self, file_ref: Union[str, FileReference], chunk_size: int = 64 * 1024) -> AsyncIterator[bytes]:
+        """Stream a file from storage in chunks.
+        
+        Args:
+            file_ref: File reference (path string or FileReference object)
+            chunk_size: Maximum size of each yielded chunk in bytes
+            
+        Yields:
+            Consecutive chunks of the file; nothing if the file is not found
+        """
+        try:
+            provider = self._get_provider_for_reference(file_ref)
+        except ValueError as e:
+            self.logger.exception(f"Error streaming file {file_ref}: {e}")
+            return
+        
+        file_path = file_ref.reference if isinstance(file_ref, FileReference) else file_ref
+        self.logger.debug(f"Streaming file: {file_ref}")
+        
+        async for chunk in provider.get_file_stream(file_path, chunk_size):
+            yield chunk
+    
     async def delete_file(self, file_ref: Union[str, FileReference]) -> bool:
         """Delete a file from storage.
         
@@ -356,6 +378,23 @@ class FileStorageService:
             self.logger.exception(f"Error getting file size {file_ref}: {e}")
             return None
     
+    async def get_file_version(self, file_ref: Union[str, FileReference]) -> Optional[str]:
+        """Get a marker that changes whenever the file content changes.
+        
+        Args:
+            file_ref: File reference (path string or FileReference object)
+            
+        Returns:
+            Version marker (e.g. ETag or modification time) if known, None otherwise
+        """
+        try:
+            provider = self._get_provider_for_reference(file_ref)
+            file_path = file_ref.reference if isinstance(file_ref, FileReference) else file_ref
+            return await provider.get_file_version(file_path)
+        except ValueError as e:
+            self.logger.exception(f"Error getting file version {file_ref}: {e}")
+            return None
+    
     async def copy_file(self, source_path: str, destination_path: str) -> bool:
         """Copy a file from source to destination.
         
@@ -40,6 +40,9 @@ class AppSettings:
         # Redis settings (if using Redis for collections)
         self.redis_url = os.getenv("REDIS_URL")
         self.redis_db = int(os.getenv("REDIS_DB", "0"))
+        self.redis_max_connections = int(os.getenv("REDIS_MAX_CONNECTIONS", "50"))
+        self.redis_health_check_interval = int(os.getenv("REDIS_HEALTH_CHECK_INTERVAL", "30"))
+        self.redis_connect_timeout = float(os.getenv("REDIS_CONNECT_TIMEOUT", "5"))
         print("redis -> " , self.redis_url)
         
         # CORS settings
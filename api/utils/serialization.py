@@ -0,0 +1,26 @@
+"""Fast JSON helpers.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise, so callers get the same str-in/str-out behaviour either way.
+"""
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+    import json
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON string or bytes payload."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)